@@ -0,0 +1,32 @@
+"""Add indexes for keyset pagination
+
+Revision ID: 005_keyset_pagination
+Revises: 004_slim_users
+Create Date: 2026-10-17
+
+List endpoints page by (created_at, id) with a row-value comparison; these
+indexes let each page start with an index range scan. users pages by its
+primary key, which is already indexed.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = "005_keyset_pagination"
+down_revision: Union[str, None] = "004_slim_users"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index("idx_parks_created_at_id", "parks", ["created_at", "id"])
+    op.create_index(
+        "idx_parks_status_created_at_id", "parks", ["status", "created_at", "id"]
+    )
+    op.create_index("idx_equipment_created_at_id", "equipment", ["created_at", "id"])
+
+
+def downgrade() -> None:
+    op.drop_index("idx_equipment_created_at_id", table_name="equipment")
+    op.drop_index("idx_parks_status_created_at_id", table_name="parks")
+    op.drop_index("idx_parks_created_at_id", table_name="parks")
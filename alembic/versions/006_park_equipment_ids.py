@@ -0,0 +1,55 @@
+"""Add denormalized parks.equipment_ids for equipment filters
+
+Revision ID: 006_park_equipment_ids
+Revises: 005_keyset_pagination
+Create Date: 2026-10-17
+
+Copies each park's park_equipment rows into a UUID[] column with a GIN index,
+so "parks with all/any of these equipment" is a single @> / && predicate
+instead of a join per park. The application keeps the column in sync.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+revision: str = "006_park_equipment_ids"
+down_revision: Union[str, None] = "005_keyset_pagination"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "parks",
+        sa.Column(
+            "equipment_ids",
+            postgresql.ARRAY(postgresql.UUID(as_uuid=True)),
+            nullable=False,
+            server_default="{}",
+        ),
+    )
+    op.execute(
+        """
+        UPDATE parks p
+        SET equipment_ids = pe.equipment_ids
+        FROM (
+            SELECT park_id, array_agg(equipment_id ORDER BY equipment_id) AS equipment_ids
+            FROM park_equipment
+            GROUP BY park_id
+        ) pe
+        WHERE p.id = pe.park_id
+        """
+    )
+    op.create_index(
+        "idx_parks_equipment_ids",
+        "parks",
+        ["equipment_ids"],
+        postgresql_using="gin",
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("idx_parks_equipment_ids", table_name="parks")
+    op.drop_column("parks", "equipment_ids")
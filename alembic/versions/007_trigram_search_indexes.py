@@ -0,0 +1,41 @@
+"""Add pg_trgm indexes for admin submission search
+
+Revision ID: 007_trigram_search
+Revises: 006_park_equipment_ids
+Create Date: 2026-10-17
+
+Submission search is a case-insensitive substring match on parks.name,
+parks.address and users.name. Trigram GIN indexes let Postgres answer those
+ILIKE '%term%' predicates with index scans instead of a sequential scan.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = "007_trigram_search"
+down_revision: Union[str, None] = "006_park_equipment_ids"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+TRIGRAM_INDEXES = (
+    ("idx_parks_name_trgm", "parks", "name"),
+    ("idx_parks_address_trgm", "parks", "address"),
+    ("idx_users_name_trgm", "users", "name"),
+)
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    for name, table, column in TRIGRAM_INDEXES:
+        op.create_index(
+            name,
+            table,
+            [column],
+            postgresql_using="gin",
+            postgresql_ops={column: "gin_trgm_ops"},
+        )
+
+
+def downgrade() -> None:
+    for name, table, _ in reversed(TRIGRAM_INDEXES):
+        op.drop_index(name, table_name=table)
@@ -0,0 +1,72 @@
+"""Add trigger-maintained park_status_counts
+
+Revision ID: 008_park_status_counts
+Revises: 007_trigram_search
+Create Date: 2026-10-17
+
+Keeps one row per park status with the number of parks in it, updated by a
+row trigger on parks, so the admin feed can read totals instead of running
+COUNT(*) on every page.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = "008_park_status_counts"
+down_revision: Union[str, None] = "007_trigram_search"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "park_status_counts",
+        sa.Column("status", sa.String(50), primary_key=True),
+        sa.Column("count", sa.BigInteger(), nullable=False, server_default="0"),
+    )
+    op.execute(
+        """
+        INSERT INTO park_status_counts (status, count)
+        SELECT status, COUNT(*) FROM parks GROUP BY status
+        """
+    )
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION update_park_status_counts()
+        RETURNS TRIGGER AS $$
+        BEGIN
+            IF TG_OP IN ('UPDATE', 'DELETE') THEN
+                UPDATE park_status_counts SET count = count - 1 WHERE status = OLD.status;
+            END IF;
+            IF TG_OP IN ('INSERT', 'UPDATE') THEN
+                INSERT INTO park_status_counts (status, count) VALUES (NEW.status, 1)
+                ON CONFLICT (status) DO UPDATE SET count = park_status_counts.count + 1;
+            END IF;
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql;
+        """
+    )
+    op.execute(
+        """
+        CREATE TRIGGER park_status_counts_insert_delete
+        AFTER INSERT OR DELETE ON parks
+        FOR EACH ROW EXECUTE FUNCTION update_park_status_counts();
+        """
+    )
+    op.execute(
+        """
+        CREATE TRIGGER park_status_counts_update
+        AFTER UPDATE OF status ON parks
+        FOR EACH ROW WHEN (OLD.status IS DISTINCT FROM NEW.status)
+        EXECUTE FUNCTION update_park_status_counts();
+        """
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP TRIGGER IF EXISTS park_status_counts_update ON parks")
+    op.execute("DROP TRIGGER IF EXISTS park_status_counts_insert_delete ON parks")
+    op.execute("DROP FUNCTION IF EXISTS update_park_status_counts()")
+    op.drop_table("park_status_counts")
@@ -0,0 +1,40 @@
+"""Add upcoming-events indexes for the events feed
+
+Revision ID: 009_events_upcoming
+Revises: 008_park_status_counts
+Create Date: 2026-10-17
+
+The feed reads dated events in (event_date, event_time, id) order from a
+starting date, then undated events in (created_at, id) order. Two partial
+indexes give each half its own ordered range scan, so the LIMIT stops the
+scan instead of sorting every matching event.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = "009_events_upcoming"
+down_revision: Union[str, None] = "008_park_status_counts"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "idx_events_upcoming",
+        "events",
+        ["event_date", "event_time", "id"],
+        postgresql_where=sa.text("event_date IS NOT NULL"),
+    )
+    op.create_index(
+        "idx_events_undated_created_at_id",
+        "events",
+        ["created_at", "id"],
+        postgresql_where=sa.text("event_date IS NULL"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("idx_events_undated_created_at_id", table_name="events")
+    op.drop_index("idx_events_upcoming", table_name="events")
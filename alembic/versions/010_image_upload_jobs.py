@@ -0,0 +1,91 @@
+"""Add image upload job queue and parks.image_status
+
+Revision ID: 010_image_upload_jobs
+Revises: 009_events_upcoming
+Create Date: 2026-10-17
+
+Asynchronous park submissions commit the park at once and queue one
+image_upload_jobs row per image; workers claim rows with
+FOR UPDATE SKIP LOCKED, upload to Cloudflare and retry with backoff.
+parks.image_status summarises the park's jobs for status polling.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+revision: str = "010_image_upload_jobs"
+down_revision: Union[str, None] = "009_events_upcoming"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "parks",
+        sa.Column("image_status", sa.String(20), nullable=False, server_default="none"),
+    )
+    op.create_check_constraint(
+        "check_park_image_status",
+        "parks",
+        "image_status IN ('none', 'processing', 'complete', 'partial', 'failed')",
+    )
+
+    op.create_table(
+        "image_upload_jobs",
+        sa.Column(
+            "id",
+            postgresql.UUID(as_uuid=True),
+            primary_key=True,
+            server_default=sa.text("gen_random_uuid()"),
+        ),
+        sa.Column(
+            "park_id",
+            postgresql.UUID(as_uuid=True),
+            sa.ForeignKey("parks.id", ondelete="CASCADE"),
+            nullable=False,
+        ),
+        sa.Column("position", sa.Integer(), nullable=False),
+        sa.Column("file_path", sa.Text(), nullable=False),
+        sa.Column("alt_text", sa.String(255), nullable=True),
+        sa.Column(
+            "uploaded_by",
+            postgresql.UUID(as_uuid=True),
+            sa.ForeignKey("users.id", ondelete="SET NULL"),
+            nullable=True,
+        ),
+        sa.Column("status", sa.String(20), nullable=False, server_default="queued"),
+        sa.Column("attempts", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("max_attempts", sa.Integer(), nullable=False, server_default="5"),
+        sa.Column("run_after", sa.DateTime(timezone=True), nullable=False, server_default=sa.func.now()),
+        sa.Column("locked_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("last_error", sa.Text(), nullable=True),
+        sa.Column(
+            "image_id",
+            postgresql.UUID(as_uuid=True),
+            sa.ForeignKey("images.id", ondelete="SET NULL"),
+            nullable=True,
+        ),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False, server_default=sa.func.now()),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=False, server_default=sa.func.now()),
+        sa.CheckConstraint(
+            "status IN ('queued', 'running', 'done', 'failed')",
+            name="check_image_upload_job_status",
+        ),
+        sa.UniqueConstraint("park_id", "position", name="uq_image_upload_jobs_park_position"),
+    )
+    # Claim scans: only unfinished jobs, oldest due first.
+    op.create_index(
+        "idx_image_upload_jobs_due",
+        "image_upload_jobs",
+        ["run_after", "created_at"],
+        postgresql_where=sa.text("status IN ('queued', 'running')"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("idx_image_upload_jobs_due", table_name="image_upload_jobs")
+    op.drop_table("image_upload_jobs")
+    op.drop_constraint("check_park_image_status", "parks", type_="check")
+    op.drop_column("parks", "image_status")
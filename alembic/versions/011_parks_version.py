@@ -0,0 +1,63 @@
+"""Add trigger-maintained parks_version counter
+
+Revision ID: 011_parks_version
+Revises: 010_image_upload_jobs
+Create Date: 2026-10-17
+
+Keeps a single row whose version is bumped by statement triggers on parks
+and park_equipment, so list ETags can read one row instead of running
+COUNT(*) / MAX(updated_at) over the whole parks table on every request.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = "011_parks_version"
+down_revision: Union[str, None] = "010_image_upload_jobs"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "parks_version",
+        sa.Column("id", sa.SmallInteger(), primary_key=True, server_default="1"),
+        sa.Column("version", sa.BigInteger(), nullable=False, server_default="0"),
+        sa.CheckConstraint("id = 1", name="check_parks_version_single_row"),
+    )
+    op.execute("INSERT INTO parks_version (id, version) VALUES (1, 0)")
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION bump_parks_version()
+        RETURNS TRIGGER AS $$
+        BEGIN
+            UPDATE parks_version SET version = version + 1 WHERE id = 1;
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql;
+        """
+    )
+    # Statement level: one bump per write statement, not per row.
+    op.execute(
+        """
+        CREATE TRIGGER parks_version_parks
+        AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON parks
+        FOR EACH STATEMENT EXECUTE FUNCTION bump_parks_version();
+        """
+    )
+    # Park responses carry equipment_ids, so equipment links count as park changes.
+    op.execute(
+        """
+        CREATE TRIGGER parks_version_park_equipment
+        AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON park_equipment
+        FOR EACH STATEMENT EXECUTE FUNCTION bump_parks_version();
+        """
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP TRIGGER IF EXISTS parks_version_park_equipment ON park_equipment")
+    op.execute("DROP TRIGGER IF EXISTS parks_version_parks ON parks")
+    op.execute("DROP FUNCTION IF EXISTS bump_parks_version()")
+    op.drop_table("parks_version")
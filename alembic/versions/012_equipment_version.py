@@ -0,0 +1,53 @@
+"""Add trigger-maintained equipment_version counter
+
+Revision ID: 012_equipment_version
+Revises: 011_parks_version
+Create Date: 2026-10-17
+
+Same single-row counter as parks_version, bumped by a statement trigger on
+equipment, so the equipment list ETag also changes on in-place edits
+(equipment has no updated_at column).
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = "012_equipment_version"
+down_revision: Union[str, None] = "011_parks_version"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "equipment_version",
+        sa.Column("id", sa.SmallInteger(), primary_key=True, server_default="1"),
+        sa.Column("version", sa.BigInteger(), nullable=False, server_default="0"),
+        sa.CheckConstraint("id = 1", name="check_equipment_version_single_row"),
+    )
+    op.execute("INSERT INTO equipment_version (id, version) VALUES (1, 0)")
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION bump_equipment_version()
+        RETURNS TRIGGER AS $$
+        BEGIN
+            UPDATE equipment_version SET version = version + 1 WHERE id = 1;
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql;
+        """
+    )
+    op.execute(
+        """
+        CREATE TRIGGER equipment_version_equipment
+        AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON equipment
+        FOR EACH STATEMENT EXECUTE FUNCTION bump_equipment_version();
+        """
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP TRIGGER IF EXISTS equipment_version_equipment ON equipment")
+    op.execute("DROP FUNCTION IF EXISTS bump_equipment_version()")
+    op.drop_table("equipment_version")
@@ -1,6 +1,7 @@
 """
 API routers for BarzMap (trimmed to endpoints used by the frontend).
 """
+from .admin import router as admin_router
 from .parks import router as parks_router
 from .equipment import router as equipment_router
 from .events import router as events_router
@@ -9,6 +10,7 @@ from .park_equipment import router as park_equipment_router
 from .users import router as users_router
 
 __all__ = [
+    "admin_router",
     "parks_router",
     "equipment_router",
     "events_router",
@@ -0,0 +1,50 @@
+"""
+Admin endpoints (park submission feed per docs/FEDC.md).
+"""
+from typing import Optional
+from uuid import UUID
+
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy.orm import Session
+
+from models.responses.AdminResponses import (
+    AdminStatsResponse,
+    ParkSubmissionDetail,
+    ParkSubmissionsListResponse,
+)
+from models.responses.CloudflareImageResponses import CloudflarePoolStatsResponse
+from services.Database import get_db
+from services.Manager.Images import get_cloudflare_pool_stats
+from services.Manager.Parks import get_admin_stats, get_park_submission, get_park_submissions
+
+router = APIRouter()
+
+
+@router.get("/park-submissions", response_model=ParkSubmissionsListResponse, tags=["Admin"])
+def list_park_submissions(
+    status: str = Query("pending", regex="^(pending|approved|rejected|all)$", description="Submission status, or `all`"),
+    search: Optional[str] = Query(None, description="Match on title, address, or submitter name"),
+    page: int = Query(1, ge=1, description="Page number, starting at 1"),
+    page_size: int = Query(20, ge=1, le=100, alias="pageSize", description="Items per page"),
+    db: Session = Depends(get_db),
+):
+    """Paginated park submission feed for the admin dashboard."""
+    return get_park_submissions(db, status=status, search=search, page=page, page_size=page_size)
+
+
+@router.get("/park-submissions/{submission_id}", response_model=ParkSubmissionDetail, tags=["Admin"])
+def get_park_submission_endpoint(submission_id: UUID, db: Session = Depends(get_db)):
+    """Full detail for one park submission."""
+    return get_park_submission(db, submission_id)
+
+
+@router.get("/stats", response_model=AdminStatsResponse, tags=["Admin"])
+def get_admin_stats_endpoint(db: Session = Depends(get_db)):
+    """Park totals per moderation status."""
+    return get_admin_stats(db)
+
+
+@router.get("/cloudflare-pool", response_model=CloudflarePoolStatsResponse, tags=["Admin"])
+def get_cloudflare_pool_stats_endpoint():
+    """Connection pool metrics for the Cloudflare Images client."""
+    return get_cloudflare_pool_stats()
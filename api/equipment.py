@@ -2,22 +2,35 @@
 Equipment endpoint used by the frontend: list equipment types.
 """
 
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, Header, Query, Request, Response
 from sqlalchemy.orm import Session
-from typing import List
+from typing import List, Optional
 
 from models.responses.EquipmentResponses import EquipmentResponse
 from services.Database import get_db
+from services.Manager.ETags import etag_matches, get_equipment_etag
 from services.Manager.Equipment import get_all_equipment_types
+from services.Manager.FastJSON import FastJSONResponse
 
 router = APIRouter()
 
 
 @router.get("/", response_model=List[EquipmentResponse], tags=["Equipment"])
 def get_all_equipment_types_endpoint(
+    request: Request,
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=100),
+    cursor: Optional[str] = Query(None, description="Opaque cursor from a previous page's X-Next-Cursor header; replaces skip"),
+    if_none_match: Optional[str] = Header(None, description="ETag from a previous response; 304 if unchanged"),
     db: Session = Depends(get_db),
 ):
-    """Get all equipment types."""
-    return get_all_equipment_types(db, skip=skip, limit=limit)
+    """Get all equipment types. `X-Next-Cursor` is set when more results exist."""
+    etag = get_equipment_etag(db, request)
+    if etag_matches(if_none_match, etag):
+        return Response(status_code=304, headers={"ETag": etag})
+
+    equipment, next_cursor = get_all_equipment_types(db, skip=skip, limit=limit, cursor=cursor)
+    headers = {"ETag": etag}
+    if next_cursor:
+        headers["X-Next-Cursor"] = next_cursor
+    return FastJSONResponse(content=equipment, headers=headers)
@@ -1,13 +1,15 @@
 """
-Event endpoint used by the frontend: events feed.
+Event endpoints: events feed and export.
 """
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, Header, Query
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
 from typing import Optional
 
 from models.responses.EventsResponses import EventsListResponse
 from services.Database import get_db
 from services.Manager.Events import get_events_feed
+from services.Manager.Exports import EXPORT_MEDIA_TYPES, accepts_gzip, stream_events_export
 
 router = APIRouter()
 
@@ -30,3 +32,23 @@ def get_events_endpoint(
         limit=limit,
         from_date_str=fromDate,
     )
+
+
+@router.get("/export", tags=["Events"])
+def export_events(
+    format: str = Query("ndjson", regex="^(ndjson|csv)$", description="`ndjson` (one JSON object per line) or `csv`"),
+    accept_encoding: Optional[str] = Header(None),
+):
+    """Stream every event as NDJSON or CSV, gzipped on the fly when accepted."""
+    compress = accepts_gzip(accept_encoding)
+    headers = {
+        "Content-Disposition": f'attachment; filename="events.{format}"',
+        "Vary": "Accept-Encoding",
+    }
+    if compress:
+        headers["Content-Encoding"] = "gzip"
+    return StreamingResponse(
+        stream_events_export(format, compress=compress),
+        media_type=EXPORT_MEDIA_TYPES[format],
+        headers=headers,
+    )
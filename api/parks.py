@@ -1,5 +1,7 @@
-from fastapi import APIRouter, Depends, File, Form, Query
+from fastapi import APIRouter, Depends, File, Form, Header, Query, Request, Response
 from fastapi.datastructures import UploadFile
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import FileResponse, JSONResponse, StreamingResponse
 from pydantic import BaseModel
 from sqlalchemy.orm import Session
 from typing import List, Optional
@@ -7,13 +9,47 @@ from uuid import UUID
 import logging
 
 from models.requests.admin import ModerateParkSubmissionRequest
+from models.requests.parks import ParkLocationBatchRequest
 from models.responses.AdminResponses import ParkSubmissionDetail
-from models.responses.ParksResponses import ParkResponse
+from models.responses.ParksResponses import (
+    NearestParksResponse,
+    ParkLocationBatchResponse,
+    ParkLocationCacheStatsResponse,
+    ParkLocationDeltaResponse,
+    ParkResponse,
+    ParkTileResponse,
+)
+from models.responses.ParkSubmissionResponse import (
+    ParkSubmissionAcceptedResponse,
+    ParkSubmissionStatusResponse,
+)
 from services.Database import get_db
-from services.Manager.ParkSubmissions import process_submission, parse_submission_form_data
+from services.Manager.ETags import etag_matches, get_parks_etag, get_parks_location_etag
+from services.Manager.FastJSON import FastJSONResponse
+from services.Manager.Exports import EXPORT_MEDIA_TYPES, accepts_gzip, stream_parks_export
+from services.Manager.ParkClusters import get_park_tile
+from services.Manager.ParkSnapshots import Snapshot, get_current_snapshot, get_snapshot_version
+from services.Manager.ParkPins import (
+    PIN_FIELDS,
+    PINS_MEDIA_TYPE,
+    encode_park_pins,
+    wants_park_pins,
+)
+from services.Manager.ImageUploadQueue import get_submission_status
+from services.Manager.ParkSubmissions import (
+    accept_submission,
+    parse_submission_form_data,
+    process_submission,
+)
 from services.Manager.Parks import (
     get_parks_list,
     get_parks_in_location,
+    get_location_cache_stats,
+    parse_equipment_filter,
+    parse_park_fields,
+    get_parks_in_locations,
+    get_parks_location_delta,
+    get_nearest_parks,
     moderate_park_submission as manager_moderate_park_submission,
     delete_park_submission as manager_delete_park_submission,
 )
@@ -28,39 +64,270 @@ class ParkSubmissionResponse(BaseModel):
     submitted: bool
 
 
+FIELDS_DESCRIPTION = (
+    "Comma-separated park fields to return, e.g. `id,name,latitude,longitude` "
+    "for map pins. `id` is always included. Omit for full park objects."
+)
+
+
+EQUIPMENT_DESCRIPTION = "Comma-separated equipment ids the park must have"
+EQUIPMENT_MATCH_DESCRIPTION = "Require all of the listed equipment, or any of it"
+ACCEPT_DESCRIPTION = (
+    f"Send `{PINS_MEDIA_TYPE}` for a compact columnar binary pin payload "
+    "(id, name, coordinates, status) instead of JSON."
+)
+
+
+def _park_list_response(parks: list[dict], headers: dict, binary: bool) -> Response:
+    """Encode a park list as binary pins or (orjson) JSON."""
+    if binary:
+        return Response(content=encode_park_pins(parks), media_type=PINS_MEDIA_TYPE, headers=headers)
+    return FastJSONResponse(content=parks, headers=headers)
+
+
 @router.get("/", response_model=List[ParkResponse], tags=["Parks"])
 def get_parks(
+    request: Request,
     skip: int = Query(0, ge=0, description="Number of records to skip"),
     limit: int = Query(100, ge=1, le=100, description="Maximum number of records to return"),
     status: Optional[str] = Query(None, regex="^(pending|approved|rejected)$", description="Filter by park status"),
+    cursor: Optional[str] = Query(None, description="Opaque cursor from a previous page's X-Next-Cursor header; replaces skip"),
+    fields: Optional[str] = Query(None, description=FIELDS_DESCRIPTION),
+    equipment: Optional[str] = Query(None, description=EQUIPMENT_DESCRIPTION),
+    equipment_match: str = Query("all", regex="^(all|any)$", description=EQUIPMENT_MATCH_DESCRIPTION),
+    accept: Optional[str] = Header(None, description=ACCEPT_DESCRIPTION),
+    if_none_match: Optional[str] = Header(None, description="ETag from a previous response; 304 if unchanged"),
     db: Session = Depends(get_db)
 ):
-    """Get all parks with optional filtering."""
-    return get_parks_list(db, skip=skip, limit=limit, status=status)
+    """
+    Get all parks with optional filtering, ordered by creation time.
+
+    When more results exist, the `X-Next-Cursor` response header holds a
+    cursor for the next page.
+    """
+    binary = wants_park_pins(accept)
+    field_list = PIN_FIELDS if binary else parse_park_fields(fields)
+    equipment_ids = parse_equipment_filter(equipment)
+    etag = get_parks_etag(db, request, "pins" if binary else "json")
+    headers = {"ETag": etag, "Vary": "Accept"}
+    if etag_matches(if_none_match, etag):
+        return Response(status_code=304, headers=headers)
+
+    parks, next_cursor = get_parks_list(
+        db,
+        skip=skip,
+        limit=limit,
+        status=status,
+        cursor=cursor,
+        fields=field_list,
+        equipment_ids=equipment_ids,
+        equipment_match=equipment_match,
+    )
+    if next_cursor:
+        headers["X-Next-Cursor"] = next_cursor
+    return _park_list_response(parks, headers, binary)
+
+
+@router.get("/export", tags=["Parks"])
+def export_parks(
+    format: str = Query("ndjson", regex="^(ndjson|csv)$", description="`ndjson` (one JSON object per line) or `csv`"),
+    status: Optional[str] = Query(None, regex="^(pending|approved|rejected)$", description="Filter by park status"),
+    accept_encoding: Optional[str] = Header(None),
+):
+    """
+    Stream every park as NDJSON or CSV. Rows are read through a server-side
+    cursor and written as they arrive; the body is gzipped on the fly when the
+    client accepts it.
+    """
+    compress = accepts_gzip(accept_encoding)
+    headers = {
+        "Content-Disposition": f'attachment; filename="parks.{format}"',
+        "Vary": "Accept-Encoding",
+    }
+    if compress:
+        headers["Content-Encoding"] = "gzip"
+    return StreamingResponse(
+        stream_parks_export(format, status=status, compress=compress),
+        media_type=EXPORT_MEDIA_TYPES[format],
+        headers=headers,
+    )
+
+
+def _snapshot_response(
+    snapshot: Snapshot,
+    accept_encoding: Optional[str],
+    if_none_match: Optional[str],
+    cache_control: str,
+) -> Response:
+    path, coding = snapshot.path_for(accept_encoding)
+    etag = snapshot.etag_for(coding)
+    headers = {
+        "ETag": etag,
+        "Cache-Control": cache_control,
+        "Vary": "Accept-Encoding",
+        "X-Snapshot-Version": snapshot.version,
+    }
+    if etag_matches(if_none_match, etag):
+        return Response(status_code=304, headers=headers)
+    if coding:
+        headers["Content-Encoding"] = coding
+    return FileResponse(path, media_type="application/json", headers=headers)
+
+
+@router.get("/snapshot", tags=["Parks"])
+def get_parks_snapshot(
+    accept_encoding: Optional[str] = Header(None),
+    if_none_match: Optional[str] = Header(None, description="ETag from a previous response; 304 if unchanged"),
+    db: Session = Depends(get_db),
+):
+    """
+    Every approved park as `{"fields": [...], "parks": [[id, name, latitude, longitude], ...]}`,
+    served from a precompressed file. `X-Snapshot-Version` names the version,
+    which can be fetched (and cached forever) at `/snapshot/{version}`.
+    """
+    snapshot = get_current_snapshot(db)
+    return _snapshot_response(
+        snapshot, accept_encoding, if_none_match, "public, max-age=60, stale-while-revalidate=600"
+    )
+
+
+@router.get("/snapshot/{version}", tags=["Parks"])
+def get_parks_snapshot_version(
+    version: str,
+    accept_encoding: Optional[str] = Header(None),
+    if_none_match: Optional[str] = Header(None, description="ETag from a previous response; 304 if unchanged"),
+):
+    """One immutable snapshot version (recent versions only)."""
+    snapshot = get_snapshot_version(version)
+    return _snapshot_response(
+        snapshot, accept_encoding, if_none_match, "public, max-age=31536000, immutable"
+    )
 
 
 @router.get("/location", response_model=List[ParkResponse], tags=["Parks"])
 def get_parks_in_location_endpoint(
+    request: Request,
     min_latitude: float = Query(..., description="Minimum latitude"),
     max_latitude: float = Query(..., description="Maximum latitude"),
     min_longitude: float = Query(..., description="Minimum longitude"),
     max_longitude: float = Query(..., description="Maximum longitude"),
     status: Optional[str] = Query("approved", regex="^(pending|approved|rejected)$", description="Filter by park status"),
+    fields: Optional[str] = Query(None, description=FIELDS_DESCRIPTION),
+    equipment: Optional[str] = Query(None, description=EQUIPMENT_DESCRIPTION),
+    equipment_match: str = Query("all", regex="^(all|any)$", description=EQUIPMENT_MATCH_DESCRIPTION),
+    accept: Optional[str] = Header(None, description=ACCEPT_DESCRIPTION),
+    if_none_match: Optional[str] = Header(None, description="ETag from a previous response; 304 if unchanged"),
     db: Session = Depends(get_db)
 ):
     """Get parks within a geographic bounding box."""
-    return get_parks_in_location(
+    binary = wants_park_pins(accept)
+    field_list = PIN_FIELDS if binary else parse_park_fields(fields)
+    equipment_ids = parse_equipment_filter(equipment)
+    etag = get_parks_location_etag(db, request, status, "pins" if binary else "json")
+    headers = {"ETag": etag, "Vary": "Accept"}
+    if etag_matches(if_none_match, etag):
+        return Response(status_code=304, headers=headers)
+
+    parks = get_parks_in_location(
+        db,
+        min_latitude=min_latitude,
+        max_latitude=max_latitude,
+        min_longitude=min_longitude,
+        max_longitude=max_longitude,
+        status=status,
+        fields=field_list,
+        equipment_ids=equipment_ids,
+        equipment_match=equipment_match,
+    )
+    return _park_list_response(parks, headers, binary)
+
+
+@router.get("/location/cache-stats", response_model=ParkLocationCacheStatsResponse, tags=["Parks"])
+def get_location_cache_stats_endpoint():
+    """Hit, miss and eviction counters of the location tile cache (this worker only)."""
+    return get_location_cache_stats()
+
+
+@router.get("/location/delta", response_model=ParkLocationDeltaResponse, tags=["Parks"])
+def get_parks_location_delta_endpoint(
+    min_latitude: float = Query(..., description="Minimum latitude"),
+    max_latitude: float = Query(..., description="Maximum latitude"),
+    min_longitude: float = Query(..., description="Minimum longitude"),
+    max_longitude: float = Query(..., description="Maximum longitude"),
+    prev_min_latitude: float = Query(..., description="Minimum latitude of the previous viewport"),
+    prev_max_latitude: float = Query(..., description="Maximum latitude of the previous viewport"),
+    prev_min_longitude: float = Query(..., description="Minimum longitude of the previous viewport"),
+    prev_max_longitude: float = Query(..., description="Maximum longitude of the previous viewport"),
+    status: Optional[str] = Query("approved", regex="^(pending|approved|rejected)$", description="Filter by park status"),
+    db: Session = Depends(get_db)
+):
+    """
+    Get only what changed after a pan: parks in the newly exposed part of the
+    bounding box (`added`) and ids of parks that fell out of view (`removed`).
+    """
+    return get_parks_location_delta(
         db,
         min_latitude=min_latitude,
         max_latitude=max_latitude,
         min_longitude=min_longitude,
         max_longitude=max_longitude,
+        previous_min_latitude=prev_min_latitude,
+        previous_max_latitude=prev_max_latitude,
+        previous_min_longitude=prev_min_longitude,
+        previous_max_longitude=prev_max_longitude,
         status=status,
     )
 
 
-@router.post("/", response_model=ParkSubmissionResponse, tags=["Parks"])
+@router.post("/location/batch", response_model=ParkLocationBatchResponse, tags=["Parks"])
+def get_parks_in_locations_endpoint(
+    body: ParkLocationBatchRequest,
+    db: Session = Depends(get_db)
+):
+    """
+    Get parks for several bounding boxes in one request (split viewports,
+    prefetch areas, minimaps). Returns park ids per viewport key and each
+    matching park once.
+    """
+    return get_parks_in_locations(db, body)
+
+
+@router.get("/nearest", response_model=NearestParksResponse, tags=["Parks"])
+def get_nearest_parks_endpoint(
+    lat: float = Query(..., ge=-90, le=90, description="Latitude of the search point"),
+    lng: float = Query(..., ge=-180, le=180, description="Longitude of the search point"),
+    k: int = Query(10, ge=1, le=100, description="Number of parks to return"),
+    cursor: Optional[str] = Query(None, description="Opaque cursor from a previous page's next_cursor"),
+    db: Session = Depends(get_db)
+):
+    """Get approved parks ordered by great-circle distance (miles) from a point."""
+    return get_nearest_parks(db, latitude=lat, longitude=lng, k=k, cursor=cursor)
+
+
+@router.get("/tiles/{z}/{x}/{y}", response_model=ParkTileResponse, tags=["Parks"])
+def get_park_tile_endpoint(
+    z: int,
+    x: int,
+    y: int,
+    db: Session = Depends(get_db),
+):
+    """
+    Get approved parks for one slippy-map tile.
+
+    Below zoom 14 nearby parks are collapsed into clusters (count + centroid);
+    isolated parks and every park at zoom 14+ are returned individually.
+    """
+    return get_park_tile(db, z, x, y)
+
+
+@router.post(
+    "/",
+    response_model=ParkSubmissionResponse,
+    responses={202: {"model": ParkSubmissionAcceptedResponse, "description": "Accepted; images are uploading"}},
+    tags=["Parks"],
+)
 async def submit_park(
+    request: Request,
     name: str = Form(..., description="Name of the park"),
     description: Optional[str] = Form(None, description="Park description"),
     latitude: float = Form(..., description="Latitude coordinate"),
@@ -70,8 +337,9 @@ async def submit_park(
     equipment_ids: Optional[str] = Form(None, description="JSON array of equipment IDs: [\"uuid1\", \"uuid2\"]"),
     images: List[UploadFile] = File(default=[], description="Image files to upload (max 5). Note: Swagger UI has limitations with multiple file uploads - use Postman or curl for testing."),
     image_alt_texts: Optional[str] = Form(None, description="JSON array of alt texts for images: [\"alt1\", \"alt2\"]"),
+    run_async: bool = Query(False, alias="async", description="Return 202 at once and upload images in the background"),
     db: Session = Depends(get_db)
-) -> ParkSubmissionResponse:
+):
     """
     Submit a new park with images and equipment.
 
@@ -81,6 +349,10 @@ async def submit_park(
 
     equipment_ids should be a JSON string array: ["uuid1", "uuid2"]
     image_alt_texts should be a JSON string array: ["alt1", "alt2"] (optional, matches image order)
+
+    With `?async=true` the park is created immediately and the response is
+    202 with a `submission_id`; images upload in the background. Poll the
+    `Location` / `status_url` for progress.
     """
     submission = await parse_submission_form_data(
         name=name,
@@ -93,10 +365,25 @@ async def submit_park(
         images=images if images else [],
         image_alt_texts=image_alt_texts,
     )
+    if run_async:
+        accepted = await accept_submission(submission, db)
+        status_url = str(request.url_for("get_submission_status_endpoint", park_id=accepted.submission_id))
+        accepted = accepted.model_copy(update={"status_url": status_url})
+        return JSONResponse(
+            status_code=202,
+            content=jsonable_encoder(accepted),
+            headers={"Location": status_url},
+        )
     await process_submission(submission, db)
     return ParkSubmissionResponse(message="Park submission processed successfully", submitted=True)
 
 
+@router.get("/{park_id}/submission-status", response_model=ParkSubmissionStatusResponse, tags=["Parks"])
+def get_submission_status_endpoint(park_id: UUID, db: Session = Depends(get_db)):
+    """Image upload progress of a park submission."""
+    return get_submission_status(db, park_id)
+
+
 @router.patch("/{park_id}", response_model=ParkSubmissionDetail, tags=["Parks"])
 def moderate_park_submission(
     park_id: UUID,
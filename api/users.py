@@ -11,8 +11,8 @@ from sqlalchemy.orm import Session
 from models.requests.users import UpdateUserPermissionsRequest
 from models.responses.UsersResponses import UserResponse
 from services.Database import get_db
-from services.Database.UsersTable import get_all_users
-from services.Manager.Users import LoginSequence
+from services.Manager.FastJSON import FastJSONResponse
+from services.Manager.Users import LoginSequence, get_users_list
 from services.Adapters.Auth0ManagementAdapter import (
     deleteUser,
     getUserRoles,
@@ -30,10 +30,16 @@ def list_users(
     limit: int = Query(
         100, ge=1, le=100, description="Maximum number of records to return"
     ),
+    cursor: Optional[str] = Query(
+        None,
+        description="Opaque cursor from a previous page's X-Next-Cursor header; replaces skip",
+    ),
     db: Session = Depends(get_db),
-) -> List[UserResponse]:
-    """Return all users with pagination."""
-    return get_all_users(db, skip=skip, limit=limit)
+) -> FastJSONResponse:
+    """Return all users with pagination. `X-Next-Cursor` is set when more results exist."""
+    users, next_cursor = get_users_list(db, skip=skip, limit=limit, cursor=cursor)
+    headers = {"X-Next-Cursor": next_cursor} if next_cursor else None
+    return FastJSONResponse(content=users, headers=headers)
 
 
 @router.post("/{auth0_id}", tags=["Users"])
@@ -1,9 +1,11 @@
 import os
+from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 from api import (
+    admin_router,
     parks_router,
     images_router,
     equipment_router,
@@ -11,6 +13,8 @@ from api import (
     park_equipment_router,
     users_router,
 )
+from services.Adapters.CloudflareAdapter import close_http_client, open_http_client
+from services.Manager.ImageUploadQueue import UPLOAD_WORKER_ENABLED, image_upload_worker
 
 
 # Tag metadata for better Swagger UI organization
@@ -39,13 +43,31 @@ tags_metadata = [
         "name": "Users",
         "description": "User profiles.",
     },
+    {
+        "name": "Admin",
+        "description": "Park submission feed for moderators.",
+    },
 ]
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # One pooled HTTP/2 client for Cloudflare, shared by every request.
+    await open_http_client()
+    if UPLOAD_WORKER_ENABLED:
+        image_upload_worker.start()
+    try:
+        yield
+    finally:
+        await image_upload_worker.stop()
+        await close_http_client()
+
+
 app = FastAPI(
     title="BarzMap API",
     description="API for finding and sharing outdoor gyms and workout parks",
     version="1.0.0",
     openapi_tags=tags_metadata,
+    lifespan=lifespan,
 )
 
 cors_origins = os.getenv("CORS_ORIGINS", "*").split(",")
@@ -56,6 +78,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["ETag", "X-Next-Cursor"],
 )
 
 # Routes used by the frontend
@@ -67,3 +90,4 @@ app.include_router(
     park_equipment_router, prefix="/api/park-equipment", tags=["Park Equipment"]
 )
 app.include_router(users_router, prefix="/api/users", tags=["Users"])
+app.include_router(admin_router, prefix="/api/admin", tags=["Admin"])
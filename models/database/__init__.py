@@ -8,6 +8,10 @@ from .park_equipment import ParkEquipment
 from .image import Image
 from .review import Review
 from .event import Event
+from .park_status_count import ParkStatusCount
+from .parks_version import ParksVersion
+from .equipment_version import EquipmentVersion
+from .image_upload_job import ImageUploadJob
 
 __all__ = [
     "User",
@@ -17,5 +21,9 @@ __all__ = [
     "Image",
     "Review",
     "Event",
+    "ParkStatusCount",
+    "ParksVersion",
+    "EquipmentVersion",
+    "ImageUploadJob",
 ]
 
@@ -0,0 +1,21 @@
+"""
+EquipmentVersion ORM model.
+
+The single row is bumped by the ``bump_equipment_version`` trigger on
+``equipment`` (migration 012); the application only reads it.
+"""
+from sqlalchemy import BigInteger, CheckConstraint, Column, SmallInteger
+from core.db import Base
+
+
+class EquipmentVersion(Base):
+    __tablename__ = "equipment_version"
+    __table_args__ = (
+        CheckConstraint("id = 1", name="check_equipment_version_single_row"),
+    )
+
+    id = Column(SmallInteger, primary_key=True, server_default="1")
+    version = Column(BigInteger, nullable=False, server_default="0")
+
+    def __repr__(self):
+        return f"<EquipmentVersion(version={self.version})>"
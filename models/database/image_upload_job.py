@@ -0,0 +1,71 @@
+"""
+ImageUploadJob ORM model.
+
+One row per image of an asynchronous park submission; see
+``services/Manager/ImageUploadQueue.py`` for the worker that drains them.
+"""
+from sqlalchemy import (
+    Column, String, Text, Integer, DateTime, ForeignKey,
+    CheckConstraint, UniqueConstraint
+)
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.sql import func
+from core.db import Base
+import uuid
+
+
+class ImageUploadJob(Base):
+    __tablename__ = "image_upload_jobs"
+
+    id = Column(
+        UUID(as_uuid=True),
+        primary_key=True,
+        default=uuid.uuid4,
+        server_default=func.gen_random_uuid()
+    )
+    park_id = Column(
+        UUID(as_uuid=True),
+        ForeignKey("parks.id", ondelete="CASCADE"),
+        nullable=False
+    )
+    position = Column(Integer, nullable=False)
+    file_path = Column(Text, nullable=False)
+    alt_text = Column(String(255), nullable=True)
+    uploaded_by = Column(
+        UUID(as_uuid=True),
+        ForeignKey("users.id", ondelete="SET NULL"),
+        nullable=True
+    )
+    status = Column(String(20), default="queued", nullable=False, server_default="queued")
+    attempts = Column(Integer, default=0, nullable=False, server_default="0")
+    max_attempts = Column(Integer, default=5, nullable=False, server_default="5")
+    run_after = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    locked_at = Column(DateTime(timezone=True), nullable=True)
+    last_error = Column(Text, nullable=True)
+    image_id = Column(
+        UUID(as_uuid=True),
+        ForeignKey("images.id", ondelete="SET NULL"),
+        nullable=True
+    )
+    created_at = Column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        nullable=False
+    )
+    updated_at = Column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        onupdate=func.now(),
+        nullable=False
+    )
+
+    __table_args__ = (
+        CheckConstraint(
+            "status IN ('queued', 'running', 'done', 'failed')",
+            name="check_image_upload_job_status"
+        ),
+        UniqueConstraint("park_id", "position", name="uq_image_upload_jobs_park_position"),
+    )
+
+    def __repr__(self):
+        return f"<ImageUploadJob(id={self.id}, park_id={self.park_id}, status={self.status})>"
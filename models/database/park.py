@@ -5,7 +5,7 @@ from sqlalchemy import (
     Column, String, Text, Numeric, DateTime, ForeignKey,
     CheckConstraint
 )
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.dialects.postgresql import ARRAY, UUID
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from core.db import Base
@@ -52,6 +52,20 @@ class Park(Base):
     )
     approved_at = Column(DateTime(timezone=True), nullable=True)
     admin_notes = Column(Text, nullable=True)
+    # Denormalized copy of park_equipment.equipment_id, kept in sync by
+    # ParkEquipmentTable so equipment filters are one GIN-indexed predicate.
+    equipment_ids = Column(
+        ARRAY(UUID(as_uuid=True)),
+        nullable=False,
+        server_default="{}"
+    )
+    # Progress of queued image uploads (asynchronous submissions only).
+    image_status = Column(
+        String(20),
+        default="none",
+        nullable=False,
+        server_default="none"
+    )
     created_at = Column(
         DateTime(timezone=True),
         server_default=func.now(),
@@ -88,6 +102,10 @@ class Park(Base):
             "longitude >= -180 AND longitude <= 180",
             name="parks_longitude_range"
         ),
+        CheckConstraint(
+            "image_status IN ('none', 'processing', 'complete', 'partial', 'failed')",
+            name="check_park_image_status"
+        ),
         {"schema": None}  # Use default schema
     )
 
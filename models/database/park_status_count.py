@@ -0,0 +1,18 @@
+"""
+ParkStatusCount ORM model.
+
+Rows are maintained by the ``update_park_status_counts`` trigger on ``parks``
+(migration 008); the application only reads them.
+"""
+from sqlalchemy import BigInteger, Column, String
+from core.db import Base
+
+
+class ParkStatusCount(Base):
+    __tablename__ = "park_status_counts"
+
+    status = Column(String(50), primary_key=True)
+    count = Column(BigInteger, nullable=False, server_default="0")
+
+    def __repr__(self):
+        return f"<ParkStatusCount(status={self.status}, count={self.count})>"
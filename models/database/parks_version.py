@@ -0,0 +1,21 @@
+"""
+ParksVersion ORM model.
+
+The single row is bumped by the ``bump_parks_version`` triggers on ``parks``
+and ``park_equipment`` (migration 011); the application only reads it.
+"""
+from sqlalchemy import BigInteger, CheckConstraint, Column, SmallInteger
+from core.db import Base
+
+
+class ParksVersion(Base):
+    __tablename__ = "parks_version"
+    __table_args__ = (
+        CheckConstraint("id = 1", name="check_parks_version_single_row"),
+    )
+
+    id = Column(SmallInteger, primary_key=True, server_default="1")
+    version = Column(BigInteger, nullable=False, server_default="0")
+
+    def __repr__(self):
+        return f"<ParksVersion(version={self.version})>"
@@ -1,11 +1,12 @@
 from pydantic import BaseModel, Field, field_validator
-from typing import Optional, List
+from typing import Any, Optional, List
 from uuid import UUID
 
 
 class ImageSubmission(BaseModel):
-    """Image data for park submission."""
-    file_data: bytes = Field(..., description="Image binary data")
+    """Image for park submission, streamed from its spooled upload file."""
+    file: Any = Field(..., description="Binary file object positioned anywhere; read from the start")
+    size: int = Field(..., ge=0, description="File size in bytes")
     alt_text: Optional[str] = Field(None, max_length=255, description="Alt text for accessibility")
 
 class ParkSubmissionRequest(BaseModel):
@@ -1,5 +1,5 @@
-from pydantic import BaseModel
-from typing import Optional, Literal
+from pydantic import BaseModel, Field
+from typing import Optional, Literal, List
 from uuid import UUID
 from datetime import datetime
 
@@ -34,3 +34,18 @@ class ParkUpdate(BaseModel):
     approved_at: Optional[datetime] = None
     status: Optional[str] = None  # pending, approved, rejected
     admin_notes: Optional[str] = None
+
+
+class ParkViewport(BaseModel):
+    """One bounding box in a batch location query."""
+    key: Optional[str] = Field(None, description="Client key for this viewport; defaults to its index")
+    min_latitude: float = Field(..., ge=-90, le=90)
+    max_latitude: float = Field(..., ge=-90, le=90)
+    min_longitude: float = Field(..., ge=-180, le=180)
+    max_longitude: float = Field(..., ge=-180, le=180)
+
+
+class ParkLocationBatchRequest(BaseModel):
+    """Several bounding boxes answered in one round trip."""
+    viewports: List[ParkViewport] = Field(..., min_length=1, max_length=20)
+    status: Optional[Literal["pending", "approved", "rejected"]] = "approved"
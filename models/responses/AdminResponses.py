@@ -56,3 +56,11 @@ class ParkSubmissionDetail(BaseModel):
 
     model_config = ConfigDict(from_attributes=True)
 
+
+
+class AdminStatsResponse(BaseModel):
+    """Park totals per moderation status."""
+    pending: int = 0
+    approved: int = 0
+    rejected: int = 0
+    total: int = 0
@@ -35,3 +35,17 @@ class SingleImageUploadResult(BaseModel):
         None,
         description="Error information if upload failed",
     )
+
+
+class CloudflarePoolStatsResponse(BaseModel):
+    """Shared Cloudflare HTTP connection pool limits and counters."""
+
+    max_connections: int
+    max_keepalive_connections: int
+    connections: int = Field(0, description="Open connections")
+    active_connections: int = Field(0, description="Connections serving a request")
+    idle_connections: int = Field(0, description="Kept-alive connections ready for reuse")
+    http2_connections: int = Field(0, description="Connections negotiated as HTTP/2")
+    requests_total: int = Field(0, description="Requests sent since the pool opened")
+    requests_waiting: int = Field(0, description="Requests waiting for response headers")
+    request_errors: int = Field(0, description="Requests that failed at the transport level")
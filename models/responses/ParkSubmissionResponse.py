@@ -26,3 +26,34 @@ class ParkSubmissionResponse(BaseModel):
     
     model_config = ConfigDict(from_attributes=True)
 
+
+
+class ImageUploadStatus(BaseModel):
+    """Progress of one queued image upload."""
+    position: int = Field(..., description="Index of the image in the submission")
+    status: str = Field(..., description="queued, running, done or failed")
+    attempts: int = Field(..., description="Upload attempts so far")
+    last_error: Optional[str] = Field(None, description="Error of the last failed attempt")
+    image_id: Optional[UUID] = Field(None, description="Created image, once uploaded")
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class ParkSubmissionAcceptedResponse(BaseModel):
+    """Response for an asynchronous submission (202): the park exists, images are queued."""
+    submission_id: UUID = Field(..., description="ID of the created park")
+    status: str = Field(..., description="Moderation status of the park")
+    image_status: str = Field(..., description="none, processing, complete, partial or failed")
+    images_queued: int = Field(..., description="Number of images queued for upload")
+    status_url: Optional[str] = Field(None, description="Poll this URL for upload progress")
+
+
+class ParkSubmissionStatusResponse(BaseModel):
+    """Upload progress of a park submission."""
+    submission_id: UUID = Field(..., description="ID of the park")
+    status: str = Field(..., description="Moderation status of the park")
+    image_status: str = Field(..., description="none, processing, complete, partial or failed")
+    images_total: int = Field(..., description="Images queued with the submission")
+    images_uploaded: int = Field(..., description="Images uploaded so far")
+    images_failed: int = Field(..., description="Images that failed after all retries")
+    images: List[ImageUploadStatus] = Field(default_factory=list)
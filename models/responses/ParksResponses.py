@@ -21,8 +21,71 @@ class ParkResponse(BaseModel):
     approved_by: Optional[UUID] = None
     approved_at: Optional[datetime] = None
     admin_notes: Optional[str] = None
+    equipment_ids: list[UUID] = []
     created_at: datetime
     updated_at: datetime
 
     model_config = ConfigDict(from_attributes=True)
 
+
+class ParkPinResponse(BaseModel):
+    """Minimal park data needed to draw a map pin."""
+    id: UUID
+    name: str
+    latitude: float
+    longitude: float
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class ParkClusterResponse(BaseModel):
+    """A group of nearby parks collapsed into one map marker."""
+    id: str
+    count: int
+    latitude: float
+    longitude: float
+
+
+class ParkTileResponse(BaseModel):
+    """Clusters and individual parks inside one slippy-map tile."""
+    z: int
+    x: int
+    y: int
+    clusters: list[ParkClusterResponse] = []
+    parks: list[ParkPinResponse] = []
+
+
+class NearbyParkResponse(ParkResponse):
+    """Park with its great-circle distance from the query point."""
+    distance_miles: float
+
+
+class NearestParksResponse(BaseModel):
+    """A page of parks ordered by distance, with a cursor for the next page."""
+    data: list[NearbyParkResponse]
+    next_cursor: Optional[str] = None
+
+
+class ParkLocationBatchResponse(BaseModel):
+    """Parks for several viewports; each park appears once in ``parks``."""
+    viewports: dict[str, list[UUID]]
+    parks: list[ParkResponse]
+
+
+class ParkLocationDeltaResponse(BaseModel):
+    """Parks that entered the viewport and ids of parks that left it."""
+    added: list[ParkResponse]
+    removed: list[UUID]
+
+
+class ParkLocationCacheStatsResponse(BaseModel):
+    """Counters of the per-tile location cache."""
+    tiles: int
+    max_tiles: int
+    ttl_seconds: float
+    tile_degrees: float
+    hits: int
+    misses: int
+    evictions: int
+    expirations: int
+    bypasses: int
@@ -0,0 +1,89 @@
+"""
+Benchmark the vectorized geo kernels (``services/Manager/GeoKernels.py``)
+against the scalar ``math`` helpers called once per point in a Python loop.
+
+Times great-circle distance from one centre to every point and the bounding
+box filter, for each requested point count, and checks that both versions
+agree first.
+
+Usage:
+    python scripts/bench_geo_kernels.py [--points 1000 100000] [--repeat 5]
+"""
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import numpy as np
+
+from services.Database.EventsTable import haversine_distance
+from services.Manager.GeoKernels import haversine_miles, within_bounds
+
+CENTER = (40.7128, -74.0060)
+BOUNDS = (40.5, 40.9, -74.2, -73.8)
+
+
+def _time(label: str, fn, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    print(f"  {label:<38} {best * 1000:9.2f} ms")
+    return best
+
+
+def scalar_distances(latitudes: list, longitudes: list) -> list:
+    return [
+        haversine_distance(CENTER[0], CENTER[1], latitude, longitude)
+        for latitude, longitude in zip(latitudes, longitudes)
+    ]
+
+
+def scalar_within(latitudes: list, longitudes: list) -> list:
+    min_lat, max_lat, min_lng, max_lng = BOUNDS
+    return [
+        min_lat <= latitude <= max_lat and min_lng <= longitude <= max_lng
+        for latitude, longitude in zip(latitudes, longitudes)
+    ]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--points", type=int, nargs="+", default=[1_000, 100_000])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    for count in args.points:
+        latitudes = [rng.uniform(39.5, 42.0) for _ in range(count)]
+        longitudes = [rng.uniform(-75.5, -72.5) for _ in range(count)]
+        lat_array = np.array(latitudes)
+        lng_array = np.array(longitudes)
+
+        assert np.allclose(
+            haversine_miles(*CENTER, lat_array, lng_array),
+            scalar_distances(latitudes, longitudes),
+            rtol=0,
+            atol=1e-9,
+        ), "distance kernel differs"
+        assert (
+            within_bounds(lat_array, lng_array, *BOUNDS).tolist()
+            == scalar_within(latitudes, longitudes)
+        ), "bounds kernel differs"
+
+        print(f"{count} points, best of {args.repeat}")
+        slow = _time("haversine, scalar loop", lambda: scalar_distances(latitudes, longitudes), args.repeat)
+        fast = _time("haversine, vectorized", lambda: haversine_miles(*CENTER, lat_array, lng_array), args.repeat)
+        print(f"  speedup: {slow / fast:.1f}x")
+        slow = _time("bounding box, scalar loop", lambda: scalar_within(latitudes, longitudes), args.repeat)
+        fast = _time("bounding box, vectorized", lambda: within_bounds(lat_array, lng_array, *BOUNDS), args.repeat)
+        print(f"  speedup: {slow / fast:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
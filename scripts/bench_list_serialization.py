@@ -0,0 +1,115 @@
+"""
+Benchmark list-endpoint serialization: ORM objects validated through the
+Pydantic response model and FastAPI's JSON encoder (the old path) versus
+plain Core rows encoded with orjson (``FastJSONResponse``).
+
+Without a database the rows are built in memory, which times serialization
+only. With ``--database`` both paths also run their query against the
+configured database (seed it first, e.g. ``scripts/seed_test_data.py``), so
+ORM hydration is included.
+
+Usage:
+    python scripts/bench_list_serialization.py [--rows 10000] [--repeat 5] [--database]
+"""
+import argparse
+import sys
+import time
+import uuid
+from collections import namedtuple
+from datetime import datetime, timezone
+from decimal import Decimal
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+
+from models.database import Park
+from models.responses.ParksResponses import ParkResponse
+from services.Manager.FastJSON import FastJSONResponse, rows_to_dicts
+
+FIELDS = list(ParkResponse.model_fields)
+
+
+def _park_values(i: int) -> dict:
+    now = datetime.now(timezone.utc)
+    return {
+        "id": uuid.uuid4(),
+        "name": f"Park {i}",
+        "description": "Pull-up bars, dip bars and a bench by the river.",
+        "latitude": Decimal("40.71280000") + Decimal(i) / 100000,
+        "longitude": Decimal("-74.00600000") - Decimal(i) / 100000,
+        "address": f"{i} Main St, New York, NY",
+        "status": "approved",
+        "submitted_by": uuid.uuid4(),
+        "submit_date": now,
+        "approved_by": None,
+        "approved_at": now,
+        "admin_notes": None,
+        "equipment_ids": [uuid.uuid4(), uuid.uuid4()],
+        "created_at": now,
+        "updated_at": now,
+    }
+
+
+def orm_path(parks: list) -> bytes:
+    """What FastAPI does for response_model=List[ParkResponse] with ORM objects."""
+    validated = [ParkResponse.model_validate(park) for park in parks]
+    return JSONResponse(content=jsonable_encoder(validated)).body
+
+
+def fast_path(rows: list) -> bytes:
+    return FastJSONResponse(content=rows_to_dicts(rows)).body
+
+
+def _time(label: str, fn, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    print(f"{label:<40} {best * 1000:9.1f} ms")
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, default=10_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--database", action="store_true", help="include the query against DATABASE_URL")
+    args = parser.parse_args()
+
+    if args.database:
+        from services.Database import SessionLocal, get_parks_page
+
+        db = SessionLocal()
+        try:
+            slow = _time(
+                "ORM query + Pydantic + jsonable_encoder",
+                lambda: orm_path(get_parks_page(db, limit=args.rows)[0]),
+                args.repeat,
+            )
+            fast = _time(
+                "Core rows + orjson",
+                lambda: fast_path(get_parks_page(db, limit=args.rows, fields=FIELDS)[0]),
+                args.repeat,
+            )
+        finally:
+            db.close()
+    else:
+        values = [_park_values(i) for i in range(args.rows)]
+        parks = [Park(**value) for value in values]
+        # Core rows expose _asdict(), like a namedtuple.
+        park_row = namedtuple("ParkRow", FIELDS)
+        rows = [park_row(**value) for value in values]
+        assert orm_path(parks[:50]) == fast_path(rows[:50]), "fast path output differs"
+        print(f"{args.rows} parks, best of {args.repeat} (serialization only)")
+        slow = _time("ORM objects + Pydantic + jsonable_encoder", lambda: orm_path(parks), args.repeat)
+        fast = _time("Core rows + orjson", lambda: fast_path(rows), args.repeat)
+    print(f"speedup: {slow / fast:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
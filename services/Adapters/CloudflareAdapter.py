@@ -2,13 +2,19 @@
 Cloudflare Images API adapter.
 
 Uploads images to Cloudflare Images and returns uploaded image data.
+Image files are streamed into the multipart request body in chunks, so an
+upload never holds a whole file in memory.
+
+All requests share one HTTP/2 connection pool (``open_http_client`` /
+``close_http_client``, called from the app lifespan in ``main.py``), so
+uploads and deletes reuse warm TLS connections instead of handshaking per
+image.
 """
 
 import asyncio
-import io
 import logging
 import os
-from typing import List
+from typing import BinaryIO, List, Optional
 
 import httpx
 from cloudflare import AsyncCloudflare
@@ -31,6 +37,99 @@ if not api_token:
 if not account_id:
     logger.warning("CLOUDFLARE_ACCOUNT_ID not set - Cloudflare operations may fail")
 
+# Enough of the file head to recognise every supported signature.
+SNIFF_BYTES = 16
+
+MAX_CONNECTIONS = int(os.getenv("CLOUDFLARE_MAX_CONNECTIONS", "20"))
+MAX_KEEPALIVE_CONNECTIONS = int(os.getenv("CLOUDFLARE_MAX_KEEPALIVE_CONNECTIONS", "10"))
+KEEPALIVE_EXPIRY_SECONDS = 30.0
+REQUEST_TIMEOUT_SECONDS = 30.0
+
+
+class _CountingTransport(httpx.AsyncHTTPTransport):
+    """HTTP/2 transport that also counts requests for the pool metrics."""
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.requests_total = 0
+        self.request_errors = 0
+        # Requests sent and still waiting for response headers.
+        self.requests_waiting = 0
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        self.requests_total += 1
+        self.requests_waiting += 1
+        try:
+            return await super().handle_async_request(request)
+        except Exception:
+            self.request_errors += 1
+            raise
+        finally:
+            self.requests_waiting -= 1
+
+    def stats(self) -> dict:
+        connections = self._pool.connections
+        idle = sum(1 for connection in connections if connection.is_idle())
+        return {
+            "connections": len(connections),
+            "active_connections": len(connections) - idle,
+            "idle_connections": idle,
+            "http2_connections": sum(
+                1 for connection in connections if connection.info().startswith("HTTP/2")
+            ),
+            "requests_total": self.requests_total,
+            "requests_waiting": self.requests_waiting,
+            "request_errors": self.request_errors,
+        }
+
+
+_transport: Optional[_CountingTransport] = None
+_http_client: Optional[httpx.AsyncClient] = None
+_cloudflare_client: Optional[AsyncCloudflare] = None
+
+
+async def open_http_client() -> httpx.AsyncClient:
+    """Open the shared connection pool (no-op if it is already open)."""
+    global _transport, _http_client, _cloudflare_client
+    if _http_client is None:
+        _transport = _CountingTransport(
+            http2=True,
+            limits=httpx.Limits(
+                max_connections=MAX_CONNECTIONS,
+                max_keepalive_connections=MAX_KEEPALIVE_CONNECTIONS,
+                keepalive_expiry=KEEPALIVE_EXPIRY_SECONDS,
+            ),
+        )
+        _http_client = httpx.AsyncClient(
+            transport=_transport, timeout=REQUEST_TIMEOUT_SECONDS
+        )
+        # The SDK client sends through the same pool.
+        _cloudflare_client = AsyncCloudflare(api_token=api_token, http_client=_http_client)
+    return _http_client
+
+
+async def close_http_client() -> None:
+    """Close the shared connection pool and every connection in it."""
+    global _transport, _http_client, _cloudflare_client
+    if _http_client is not None:
+        await _http_client.aclose()
+    _transport = _http_client = _cloudflare_client = None
+
+
+def get_pool_stats() -> dict:
+    """Connection pool limits and counters; counters are zero before the pool opens."""
+    counters = _transport.stats() if _transport is not None else {}
+    return {
+        "max_connections": MAX_CONNECTIONS,
+        "max_keepalive_connections": MAX_KEEPALIVE_CONNECTIONS,
+        **counters,
+    }
+
+def is_configured() -> bool:
+    """True when the Cloudflare credentials are set."""
+    return bool(api_token and account_id)
+
+
 def _content_type_and_ext(data: bytes) -> tuple[str, str]:
     """(content_type, file_extension). Uses file signature; defaults to JPEG if unknown."""
     if data.startswith(b"\xff\xd8\xff"):
@@ -62,17 +161,18 @@ def _message_from_api_body(body: dict) -> str:
 
 
 async def _post_image_to_cloudflare(
-    file_data: bytes, content_type: str, file_ext: str
+    file: BinaryIO, content_type: str, file_ext: str
 ) -> dict:
-    """POST image to Cloudflare; returns JSON body. Raises on HTTP or API failure."""
+    """POST image to Cloudflare, streaming ``file`` from its start; returns JSON body. Raises on HTTP or API failure."""
     url = f"https://api.cloudflare.com/client/v4/accounts/{account_id}/images/v1"
-    files = {"file": (f"image{file_ext}", io.BytesIO(file_data), content_type)}
+    file.seek(0)
+    files = {"file": (f"image{file_ext}", file, content_type)}
     headers = {"Authorization": f"Bearer {api_token}"}
 
-    async with httpx.AsyncClient() as client:
-        response = await client.post(url, headers=headers, files=files, timeout=30.0)
-        response.raise_for_status()
-        data = response.json()
+    client = await open_http_client()
+    response = await client.post(url, headers=headers, files=files)
+    response.raise_for_status()
+    data = response.json()
 
     if not data.get("success"):
         raise ValueError(_message_from_api_body(data))
@@ -86,15 +186,16 @@ async def upload_single_image(
     index: int, image: ImageSubmission
 ) -> SingleImageUploadResult:
     """Upload one image. Returns a result with either uploaded_image or error."""
-    if not image.file_data:
-        return _error_result(index, "Invalid input", "file_data is empty")
+    if not image.size:
+        return _error_result(index, "Invalid input", "file is empty")
 
     try:
-        content_type, file_ext = _content_type_and_ext(image.file_data)
-        logger.debug("Uploading image %s (size=%s, type=%s)", index + 1, len(image.file_data), content_type)
+        image.file.seek(0)
+        content_type, file_ext = _content_type_and_ext(image.file.read(SNIFF_BYTES))
+        logger.debug("Uploading image %s (size=%s, type=%s)", index + 1, image.size, content_type)
 
         uploaded = await _post_image_to_cloudflare(
-            image.file_data, content_type, file_ext
+            image.file, content_type, file_ext
         )
         logger.debug("Uploaded image %s: %s", index + 1, uploaded.get("id"))
         return SingleImageUploadResult(
@@ -120,7 +221,7 @@ async def upload_images(images: List[ImageSubmission]) -> List[UploadedImage]:
     """Upload many images in parallel. Returns only successful uploads. Fails if all fail."""
     if not images:
         raise HTTPException(status_code=400, detail="No images provided for upload")
-    if not api_token or not account_id:
+    if not is_configured():
         raise HTTPException(
             status_code=503,
             detail="Image upload service unavailable - missing configuration",
@@ -146,17 +247,17 @@ async def upload_images(images: List[ImageSubmission]) -> List[UploadedImage]:
 async def delete_image(image_id: str) -> None:
     """
     Delete an image from Cloudflare Images by id.
-    Uses the Cloudflare Python client. Raises on HTTP or API failure.
+    Uses the Cloudflare Python client on the shared pool. Raises on HTTP or API failure.
     """
-    if not api_token or not account_id:
+    if not is_configured():
         raise HTTPException(
             status_code=503,
             detail="Image service unavailable - missing configuration",
         )
-    async with AsyncCloudflare(api_token=api_token) as client:
-        await client.images.v1.delete(
-            image_id=image_id,
-            account_id=account_id,
-        )
+    await open_http_client()
+    await _cloudflare_client.images.v1.delete(
+        image_id=image_id,
+        account_id=account_id,
+    )
     logger.debug("Deleted image %s", image_id)
 
@@ -1,10 +1,15 @@
 """
 CRUD operations for Equipment table.
 """
+from sqlalchemy import any_, bindparam, func
+from sqlalchemy.dialects.postgresql import ARRAY, UUID as PG_UUID
 from sqlalchemy.orm import Session
-from typing import Optional, List
+from typing import Optional, List, Sequence, Set, Tuple
 from uuid import UUID
-from models.database import Equipment
+from models.database import Equipment, EquipmentVersion, Park
+from .Pagination import paginate
+
+EQUIPMENT_PAGE_ORDER = (Equipment.created_at, Equipment.id)
 
 
 def create_equipment(
@@ -30,6 +35,14 @@ def get_equipment(db: Session, equipment_id: UUID) -> Optional[Equipment]:
     return db.query(Equipment).filter(Equipment.id == equipment_id).first()
 
 
+def get_existing_equipment_ids(db: Session, equipment_ids: Sequence[UUID]) -> Set[UUID]:
+    """Which of ``equipment_ids`` exist, with one ``id = ANY(:ids)`` query."""
+    if not equipment_ids:
+        return set()
+    ids = bindparam("ids", list(set(equipment_ids)), type_=ARRAY(PG_UUID(as_uuid=True)))
+    return set(db.scalars(db.query(Equipment.id).filter(Equipment.id == any_(ids)).statement))
+
+
 def get_equipment_by_name(db: Session, name: str) -> Optional[Equipment]:
     """Get an equipment by name."""
     return db.query(Equipment).filter(Equipment.name == name).first()
@@ -41,7 +54,37 @@ def get_all_equipment(
     limit: int = 100,
 ) -> List[Equipment]:
     """Get all equipment types."""
-    return db.query(Equipment).offset(skip).limit(limit).all()
+    equipment, _ = get_equipment_page(db, skip=skip, limit=limit)
+    return equipment
+
+
+def get_equipment_page(
+    db: Session,
+    skip: int = 0,
+    limit: int = 100,
+    cursor: Optional[str] = None,
+    fields: Optional[Sequence[str]] = None,
+) -> Tuple[List[Equipment], Optional[str]]:
+    """
+    Get one page of equipment types ordered by (created_at, id) and the cursor
+    for the next page. Raises ValueError for a malformed cursor.
+
+    With ``fields`` only those columns are selected and plain rows are
+    returned instead of Equipment objects.
+    """
+    if fields:
+        query = db.query(*(getattr(Equipment, field) for field in fields))
+    else:
+        query = db.query(Equipment)
+    return paginate(query, EQUIPMENT_PAGE_ORDER, limit, skip=skip, cursor=cursor)
+
+
+def get_equipment_version(db: Session) -> int:
+    """
+    Change counter of the equipment table, bumped by a statement trigger on
+    every write (edits included); a single-row primary key lookup.
+    """
+    return db.query(EquipmentVersion.version).filter(EquipmentVersion.id == 1).scalar() or 0
 
 
 def update_equipment(
@@ -75,6 +118,10 @@ def delete_equipment(db: Session, equipment_id: UUID) -> bool:
         return False
     
     db.delete(equipment)
+    db.query(Park).filter(Park.equipment_ids.contains([equipment_id])).update(
+        {Park.equipment_ids: func.array_remove(Park.equipment_ids, equipment_id)},
+        synchronize_session=False,
+    )
     db.commit()
     return True
 
@@ -1,8 +1,9 @@
 """
 CRUD operations for Events table.
 """
-from sqlalchemy.orm import Session, joinedload
-from sqlalchemy import and_, func, case
+from sqlalchemy.orm import Session, contains_eager
+from sqlalchemy.engine import Result
+from sqlalchemy import Float, and_, cast, func, select
 from typing import Optional, List, Tuple
 from uuid import UUID
 from decimal import Decimal
@@ -10,6 +11,8 @@ from datetime import date, datetime, time
 from models.database import Event, Park
 import math
 
+EARTH_RADIUS_MILES = 3958.8
+
 
 def haversine_distance(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
     """
@@ -72,6 +75,22 @@ def calculate_bounding_box(lat: float, lng: float, radius_miles: float) -> Tuple
     return (min_lat, max_lat, min_lng, max_lng)
 
 
+def haversine_distance_sql(lat: float, lng: float, latitude_column, longitude_column):
+    """
+    SQL expression for the great circle distance (in miles) from (lat, lng) to
+    a row's coordinates; the same formula as ``haversine_distance``.
+    """
+    lat2 = cast(latitude_column, Float)
+    lng2 = cast(longitude_column, Float)
+    a = (
+        func.power(func.sin(func.radians(lat2 - lat) / 2), 2)
+        + math.cos(math.radians(lat))
+        * func.cos(func.radians(lat2))
+        * func.power(func.sin(func.radians(lng2 - lng) / 2), 2)
+    )
+    return 2 * EARTH_RADIUS_MILES * func.asin(func.least(1.0, func.sqrt(a)))
+
+
 def get_events(
     db: Session,
     lat: Optional[float] = None,
@@ -79,14 +98,19 @@ def get_events(
     radius: Optional[float] = None,
     limit: int = 10,
     from_date: Optional[datetime] = None,
-) -> List[Event]:
+) -> List[Tuple[Event, Optional[float]]]:
     """
     Get events with optional location-based filtering and date filtering.
     
-    For location filtering, this function:
-    1. First filters parks using a bounding box (SQL-level filtering)
-    2. Then fetches events for those parks
-    3. Finally does precise haversine distance calculation (Python-level filtering)
+    For location filtering, the bounding box of the radius is filtered first
+    (index-friendly), then the exact haversine distance is computed, filtered
+    and ordered in SQL with the limit pushed down, so only ``limit`` rows are
+    transferred however dense the area is.
+    
+    Without location filtering, events come back in chronological order:
+    dated events from ``from_date`` by (event_date, event_time, id), then
+    undated events by (created_at, id). Each half is its own query matching a
+    partial index, so the LIMIT is satisfied by an index scan.
     
     Args:
         db: Database session
@@ -97,59 +121,52 @@ def get_events(
         from_date: Optional datetime to filter events after this date
     
     Returns:
-        List of Event objects
+        List of (Event, distance in miles) pairs; the distance is None
+        without location filtering. Each event's park is loaded.
     """
-    # Eagerly load the park relationship to avoid lazy loading issues
-    query = db.query(Event).options(joinedload(Event.park)).join(Park)
+    # The park comes from the same join, so no second query or join per event
+    query = db.query(Event).join(Park).options(contains_eager(Event.park))
     
-    # Filter by date if provided
+    # Convert from_date to date if it's a datetime
+    from_date_only = None
     if from_date:
-        # Convert from_date to date if it's a datetime
         from_date_only = from_date.date() if isinstance(from_date, datetime) else from_date
-        query = query.filter(
-            (Event.event_date >= from_date_only) | (Event.event_date.is_(None))
-        )
     
     # Filter by location if lat/lng/radius provided
     if lat is not None and lng is not None and radius is not None:
-        # Step 1: Calculate bounding box to filter parks at SQL level
+        if from_date_only is not None:
+            query = query.filter(
+                (Event.event_date >= from_date_only) | (Event.event_date.is_(None))
+            )
         min_lat, max_lat, min_lng, max_lng = calculate_bounding_box(lat, lng, radius)
-        
-        # Step 2: Filter parks within bounding box using SQL
-        # This significantly reduces the number of events we need to process
-        query = query.filter(
+        distance = haversine_distance_sql(lat, lng, Park.latitude, Park.longitude)
+        query = query.add_columns(distance.label("distance_miles")).filter(
             and_(
                 Park.latitude >= Decimal(str(min_lat)),
                 Park.latitude <= Decimal(str(max_lat)),
                 Park.longitude >= Decimal(str(min_lng)),
                 Park.longitude <= Decimal(str(max_lng)),
-            )
+            ),
+            distance <= radius,
         )
-        
-        # Step 3: Fetch events for parks within bounding box
-        events = query.all()
-        
-        # Step 4: Filter by precise haversine distance (Python-level)
-        # This ensures we only return events within the exact radius
-        filtered_events = []
-        for event in events:
-            if event.park:
-                distance = haversine_distance(
-                    lat, lng,
-                    float(event.park.latitude),
-                    float(event.park.longitude)
-                )
-                if distance <= radius:
-                    filtered_events.append((event, distance))
-        
-        # Step 5: Sort by distance and limit
-        filtered_events.sort(key=lambda x: x[1])
-        events = [event for event, _ in filtered_events[:limit]]
-        
-        return events
-    
-    # If no location filtering, just limit and return
-    return query.limit(limit).all()
+        rows = query.order_by(distance, Event.id).limit(limit).all()
+        return [(event, distance_miles) for event, distance_miles in rows]
+    
+    # Upcoming dated events first (idx_events_upcoming)
+    dated = query.filter(Event.event_date.isnot(None))
+    if from_date_only is not None:
+        dated = dated.filter(Event.event_date >= from_date_only)
+    events = dated.order_by(
+        Event.event_date, Event.event_time, Event.id
+    ).limit(limit).all()
+    
+    # Then undated events, only when the page is not full (idx_events_undated_created_at_id)
+    if len(events) < limit:
+        events += query.filter(Event.event_date.is_(None)).order_by(
+            Event.created_at, Event.id
+        ).limit(limit - len(events)).all()
+    
+    return [(event, None) for event in events]
 
 
 def create_event(
@@ -181,3 +198,14 @@ def create_event(
 def get_event(db: Session, event_id: UUID) -> Optional[Event]:
     """Get an event by ID."""
     return db.query(Event).filter(Event.id == event_id).first()
+
+
+def stream_events(db: Session, batch_size: int = 1000) -> Result:
+    """
+    Every event as plain rows, ordered by (created_at, id), fetched through a
+    server-side cursor ``batch_size`` rows at a time.
+    """
+    query = select(*Event.__table__.columns).order_by(
+        Event.created_at, Event.id
+    ).execution_options(yield_per=batch_size)
+    return db.execute(query)
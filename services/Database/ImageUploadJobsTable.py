@@ -0,0 +1,192 @@
+"""
+Queue operations for the image_upload_jobs table. Jobs are created together
+with their park by ``create_park_submission``.
+
+Workers claim due jobs with ``FOR UPDATE SKIP LOCKED`` so several processes
+can drain the queue without double-claiming. A claim increments ``attempts``,
+which then serves as the claim's fencing token: later state changes pass it
+back and are refused once the lease expired and another worker re-claimed the
+job. Every state change that ends a job also recomputes ``parks.image_status``
+while holding the park's row lock, so concurrent jobs of one park cannot
+leave a stale summary behind.
+"""
+from datetime import timedelta
+from sqlalchemy import and_, func, or_, select, update
+from sqlalchemy.engine import Row
+from sqlalchemy.orm import Session
+from typing import List, Optional
+from uuid import UUID
+from models.database import Image, ImageUploadJob, Park
+
+
+def claim_image_upload_jobs(db: Session, limit: int, lease_seconds: float) -> List[Row]:
+    """
+    Claim up to ``limit`` due jobs: queued ones whose ``run_after`` has passed,
+    and running ones whose lease expired (their worker died). Claimed jobs are
+    marked running with ``attempts`` incremented. Commits.
+    """
+    now = func.now()
+    due = (
+        select(ImageUploadJob.id)
+        .where(
+            or_(
+                and_(ImageUploadJob.status == "queued", ImageUploadJob.run_after <= now),
+                and_(
+                    ImageUploadJob.status == "running",
+                    ImageUploadJob.locked_at < now - timedelta(seconds=lease_seconds),
+                ),
+            )
+        )
+        .order_by(ImageUploadJob.run_after, ImageUploadJob.created_at)
+        .limit(limit)
+        .with_for_update(skip_locked=True)
+    )
+    claimed = db.execute(
+        update(ImageUploadJob)
+        .where(ImageUploadJob.id.in_(due.scalar_subquery()))
+        .values(status="running", attempts=ImageUploadJob.attempts + 1, locked_at=now)
+        .returning(
+            ImageUploadJob.id,
+            ImageUploadJob.park_id,
+            ImageUploadJob.position,
+            ImageUploadJob.file_path,
+            ImageUploadJob.alt_text,
+            ImageUploadJob.uploaded_by,
+            ImageUploadJob.attempts,
+            ImageUploadJob.max_attempts,
+        )
+        .execution_options(synchronize_session=False)
+    ).all()
+    db.commit()
+    return claimed
+
+
+def _lock_running_job(
+    db: Session, job_id: UUID, park_id: UUID, attempts: int
+) -> Optional[ImageUploadJob]:
+    """Lock the park row, then return the job if it is still running under this claim."""
+    park = db.query(Park.id).filter(Park.id == park_id).with_for_update().first()
+    if park is None:
+        return None
+    return (
+        db.query(ImageUploadJob)
+        .filter(
+            ImageUploadJob.id == job_id,
+            ImageUploadJob.status == "running",
+            ImageUploadJob.attempts == attempts,
+        )
+        .first()
+    )
+
+
+def _refresh_park_image_status(db: Session, park_id: UUID) -> None:
+    """Recompute parks.image_status from its jobs (caller holds the park row lock)."""
+    counts = dict(
+        db.query(ImageUploadJob.status, func.count())
+        .filter(ImageUploadJob.park_id == park_id)
+        .group_by(ImageUploadJob.status)
+        .all()
+    )
+    if counts.get("queued") or counts.get("running"):
+        image_status = "processing"
+    elif counts.get("failed"):
+        image_status = "partial" if counts.get("done") else "failed"
+    elif counts.get("done"):
+        image_status = "complete"
+    else:
+        image_status = "none"
+    db.query(Park).filter(Park.id == park_id).update(
+        {"image_status": image_status}, synchronize_session=False
+    )
+
+
+def complete_image_upload_job(
+    db: Session,
+    job_id: UUID,
+    park_id: UUID,
+    attempts: int,
+    image_url: str,
+    thumbnail_url: Optional[str] = None,
+    alt_text: Optional[str] = None,
+    uploaded_by: Optional[UUID] = None,
+    is_primary: bool = False,
+) -> Optional[Image]:
+    """
+    Create the uploaded image and mark the job done, in one transaction.
+    ``attempts`` is the value returned by the claim. Returns None (and changes
+    nothing) if the park is gone or the job is no longer held by that claim.
+    """
+    job = _lock_running_job(db, job_id, park_id, attempts)
+    if job is None:
+        db.rollback()
+        return None
+    if is_primary:
+        db.query(Image).filter(
+            Image.park_id == park_id,
+            Image.is_primary == True
+        ).update({"is_primary": False})
+    image = Image(
+        park_id=park_id,
+        uploaded_by=uploaded_by,
+        image_url=image_url,
+        thumbnail_url=thumbnail_url,
+        alt_text=alt_text,
+        is_approved=False,
+        is_primary=is_primary,
+    )
+    db.add(image)
+    db.flush()
+    job.status = "done"
+    job.image_id = image.id
+    job.last_error = None
+    job.locked_at = None
+    _refresh_park_image_status(db, park_id)
+    db.commit()
+    return image
+
+
+def retry_image_upload_job(
+    db: Session,
+    job_id: UUID,
+    park_id: UUID,
+    attempts: int,
+    error: str,
+    delay_seconds: float,
+) -> bool:
+    """Put a claimed job back in the queue after ``delay_seconds``. Commits."""
+    job = _lock_running_job(db, job_id, park_id, attempts)
+    if job is None:
+        db.rollback()
+        return False
+    job.status = "queued"
+    job.run_after = func.now() + timedelta(seconds=delay_seconds)
+    job.last_error = error
+    job.locked_at = None
+    db.commit()
+    return True
+
+
+def fail_image_upload_job(
+    db: Session, job_id: UUID, park_id: UUID, attempts: int, error: str
+) -> bool:
+    """Mark a claimed job as permanently failed. Commits."""
+    job = _lock_running_job(db, job_id, park_id, attempts)
+    if job is None:
+        db.rollback()
+        return False
+    job.status = "failed"
+    job.last_error = error
+    job.locked_at = None
+    _refresh_park_image_status(db, park_id)
+    db.commit()
+    return True
+
+
+def get_image_upload_jobs_by_park(db: Session, park_id: UUID) -> List[ImageUploadJob]:
+    """A park's upload jobs in image order."""
+    return (
+        db.query(ImageUploadJob)
+        .filter(ImageUploadJob.park_id == park_id)
+        .order_by(ImageUploadJob.position)
+        .all()
+    )
@@ -2,7 +2,7 @@
 CRUD operations for Images table.
 """
 from sqlalchemy.orm import Session
-from typing import Optional, List
+from typing import Dict, Optional, List, Sequence
 from uuid import UUID
 from models.database import Image
 
@@ -62,6 +62,23 @@ def get_images_by_park(
     return query.all()
 
 
+def get_image_urls_by_parks(
+    db: Session,
+    park_ids: Sequence[UUID],
+) -> Dict[UUID, List[str]]:
+    """Image URLs for several parks in one query, primary image first."""
+    urls: Dict[UUID, List[str]] = {park_id: [] for park_id in park_ids}
+    if not park_ids:
+        return urls
+    rows = db.query(Image.park_id, Image.image_url).filter(
+        Image.park_id.in_(park_ids),
+        Image.image_url.isnot(None),
+    ).order_by(Image.is_primary.desc(), Image.upload_date, Image.id).all()
+    for park_id, image_url in rows:
+        urls[park_id].append(image_url)
+    return urls
+
+
 def get_primary_image(db: Session, park_id: UUID) -> Optional[Image]:
     """Get the primary image for a park."""
     return db.query(Image).filter(
@@ -1,13 +1,15 @@
 """
 CRUD operations for Park_Equipment junction table.
+
+Every write also maintains the denormalized ``parks.equipment_ids`` array in
+the same transaction. Go through ``services/Manager/ParkEquipment.py`` to
+write, so the in-memory park views pick up the changed array.
 """
+from sqlalchemy import func
 from sqlalchemy.orm import Session
-from typing import List, Optional, TYPE_CHECKING
+from typing import Dict, List, Optional, Sequence
 from uuid import UUID
-from models.database import ParkEquipment, Equipment
-
-if TYPE_CHECKING:
-    from models.database import Park
+from models.database import ParkEquipment, Equipment, Park
 
 
 def add_equipment_to_park(
@@ -26,6 +28,13 @@ def add_equipment_to_park(
         equipment_id=equipment_id,
     )
     db.add(park_equipment)
+    db.query(Park).filter(
+        Park.id == park_id,
+        ~Park.equipment_ids.contains([equipment_id]),
+    ).update(
+        {Park.equipment_ids: func.array_append(Park.equipment_ids, equipment_id)},
+        synchronize_session=False,
+    )
     db.commit()
     db.refresh(park_equipment)
     return park_equipment
@@ -42,6 +51,10 @@ def remove_equipment_from_park(
         return False
     
     db.delete(park_equipment)
+    db.query(Park).filter(Park.id == park_id).update(
+        {Park.equipment_ids: func.array_remove(Park.equipment_ids, equipment_id)},
+        synchronize_session=False,
+    )
     db.commit()
     return True
 
@@ -66,13 +79,26 @@ def get_equipment_by_park(db: Session, park_id: UUID) -> List[Equipment]:
     ).filter(ParkEquipment.park_id == park_id).all()
 
 
-def get_parks_by_equipment(db: Session, equipment_id: UUID) -> List["Park"]:
+def get_equipment_names_by_parks(
+    db: Session,
+    park_ids: Sequence[UUID],
+) -> Dict[UUID, List[str]]:
+    """Equipment names for several parks in one query."""
+    names: Dict[UUID, List[str]] = {park_id: [] for park_id in park_ids}
+    if not park_ids:
+        return names
+    rows = db.query(ParkEquipment.park_id, Equipment.name).join(
+        Equipment,
+        Equipment.id == ParkEquipment.equipment_id
+    ).filter(ParkEquipment.park_id.in_(park_ids)).order_by(Equipment.name).all()
+    for park_id, name in rows:
+        names[park_id].append(name)
+    return names
+
+
+def get_parks_by_equipment(db: Session, equipment_id: UUID) -> List[Park]:
     """Get all parks that have a specific equipment."""
-    from models.database import Park
-    return db.query(Park).join(
-        ParkEquipment,
-        Park.id == ParkEquipment.park_id
-    ).filter(ParkEquipment.equipment_id == equipment_id).all()
+    return db.query(Park).filter(Park.equipment_ids.contains([equipment_id])).all()
 
 
 def remove_all_equipment_from_park(
@@ -83,6 +109,10 @@ def remove_all_equipment_from_park(
     count = db.query(ParkEquipment).filter(
         ParkEquipment.park_id == park_id
     ).delete()
+    db.query(Park).filter(Park.id == park_id).update(
+        {Park.equipment_ids: []},
+        synchronize_session=False,
+    )
     db.commit()
     return count
 
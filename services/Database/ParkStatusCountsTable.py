@@ -0,0 +1,19 @@
+"""
+Read access to the trigger-maintained park_status_counts table.
+"""
+from sqlalchemy.orm import Session
+from typing import Dict, Optional
+from models.database import ParkStatusCount
+
+
+def get_park_status_counts(db: Session) -> Dict[str, int]:
+    """Number of parks per status, e.g. ``{"pending": 12, "approved": 340}``."""
+    return {row.status: row.count for row in db.query(ParkStatusCount).all()}
+
+
+def get_park_status_count(db: Session, status: Optional[str] = None) -> int:
+    """Number of parks with ``status``, or of all parks when ``status`` is None."""
+    counts = get_park_status_counts(db)
+    if status is None:
+        return sum(counts.values())
+    return counts.get(status, 0)
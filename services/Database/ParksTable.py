@@ -2,13 +2,58 @@
 CRUD operations for Parks table.
 """
 from sqlalchemy.orm import Session
-from sqlalchemy import and_, or_, func
-from typing import Optional, List, Tuple
+from sqlalchemy.engine import Result
+from sqlalchemy import and_, or_, func, insert, select, values, column, Integer, Numeric
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from typing import Optional, List, Sequence, Tuple
 from uuid import UUID
 from decimal import Decimal
 from datetime import datetime, timezone
-from models.database import Park
+from models.database import Image, ImageUploadJob, Park, ParkEquipment, ParksVersion
 from models.requests.parks import ModerateParkRequest
+from .Pagination import estimate_row_count, paginate
+from .ParkStatusCountsTable import get_park_status_count
+
+# Stable, indexed ordering for list pages (see idx_parks_created_at_id).
+PARK_PAGE_ORDER = (Park.created_at, Park.id)
+
+# Searches estimated to match fewer rows than this are counted exactly.
+EXACT_SEARCH_COUNT_THRESHOLD = 1000
+
+# Columns that sparse fieldset queries may select, keyed by attribute name.
+PARK_FIELD_COLUMNS = {column.key: getattr(Park, column.key) for column in Park.__table__.columns}
+
+
+def _park_columns(fields: Sequence[str], *required) -> list:
+    """Columns for a sparse fieldset, plus any ``required`` columns not already selected."""
+    columns = [PARK_FIELD_COLUMNS[field] for field in fields]
+    columns.extend(column for column in required if column.key not in fields)
+    return columns
+
+
+def _in_bounding_box(
+    min_latitude: Decimal,
+    max_latitude: Decimal,
+    min_longitude: Decimal,
+    max_longitude: Decimal,
+):
+    """SQL condition for parks inside an inclusive bounding box."""
+    return and_(
+        Park.latitude >= min_latitude,
+        Park.latitude <= max_latitude,
+        Park.longitude >= min_longitude,
+        Park.longitude <= max_longitude,
+    )
+
+
+def _has_equipment(equipment_ids: Sequence[UUID], match: str = "all"):
+    """
+    SQL condition on the GIN-indexed ``equipment_ids`` array: parks having all
+    (``@>``) or any (``&&``) of ``equipment_ids``.
+    """
+    if match == "any":
+        return Park.equipment_ids.overlap(list(equipment_ids))
+    return Park.equipment_ids.contains(list(equipment_ids))
 
 
 def create_park(
@@ -37,6 +82,81 @@ def create_park(
     return park
 
 
+def create_park_submission(
+    db: Session,
+    name: str,
+    latitude: Decimal,
+    longitude: Decimal,
+    description: Optional[str] = None,
+    address: Optional[str] = None,
+    submitted_by: Optional[UUID] = None,
+    equipment_ids: Sequence[UUID] = (),
+    images: Sequence[dict] = (),
+    image_jobs: Sequence[dict] = (),
+) -> Park:
+    """
+    Create a pending park with its equipment links, uploaded images and queued
+    image upload jobs in one transaction.
+
+    Each child table is written with a single multi-row INSERT (equipment links
+    with ON CONFLICT DO NOTHING), so a submission costs a handful of round
+    trips however many items it has, and a failure leaves nothing behind.
+
+    ``images`` are Image column dicts (image_url, thumbnail_url, ...); the
+    first one becomes the primary image. ``image_jobs`` are ImageUploadJob
+    column dicts (position, file_path, alt_text, uploaded_by); when given, the
+    park starts with image_status ``processing``.
+    """
+    equipment_ids = list(dict.fromkeys(equipment_ids))
+    try:
+        park = Park(
+            name=name,
+            description=description,
+            latitude=latitude,
+            longitude=longitude,
+            address=address,
+            submitted_by=submitted_by,
+            status="pending",
+            equipment_ids=equipment_ids,
+            image_status="processing" if image_jobs else "none",
+        )
+        db.add(park)
+        db.flush()
+
+        if equipment_ids:
+            db.execute(
+                pg_insert(ParkEquipment)
+                .values([
+                    {"park_id": park.id, "equipment_id": equipment_id}
+                    for equipment_id in equipment_ids
+                ])
+                .on_conflict_do_nothing(constraint="uq_park_equipment")
+            )
+        if images:
+            db.execute(
+                insert(Image).values([
+                    {
+                        "is_approved": False,
+                        **image,
+                        "park_id": park.id,
+                        "is_primary": index == 0,
+                    }
+                    for index, image in enumerate(images)
+                ])
+            )
+        if image_jobs:
+            db.execute(
+                insert(ImageUploadJob).values([
+                    {**job, "park_id": park.id} for job in image_jobs
+                ])
+            )
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
+    return park
+
+
 def get_park(db: Session, park_id: UUID) -> Optional[Park]:
     """Get a park by ID."""
     return db.query(Park).filter(Park.id == park_id).first()
@@ -49,10 +169,82 @@ def get_all_parks(
     status: Optional[str] = None,
 ) -> List[Park]:
     """Get all parks with optional filtering."""
-    query = db.query(Park)
+    parks, _ = get_parks_page(db, skip=skip, limit=limit, status=status)
+    return parks
+
+
+def get_parks_page(
+    db: Session,
+    skip: int = 0,
+    limit: int = 100,
+    status: Optional[str] = None,
+    cursor: Optional[str] = None,
+    fields: Optional[Sequence[str]] = None,
+    equipment_ids: Optional[Sequence[UUID]] = None,
+    equipment_match: str = "all",
+) -> Tuple[List[Park], Optional[str]]:
+    """
+    Get one page of parks ordered by (created_at, id) and the cursor for the
+    next page. Raises ValueError for a malformed cursor.
+
+    With ``fields`` only those columns (plus the ordering key) are selected
+    and rows are returned instead of Park objects. ``equipment_ids`` keeps
+    parks having all (or, with ``equipment_match="any"``, any) of them.
+    """
+    if fields:
+        query = db.query(*_park_columns(fields, *PARK_PAGE_ORDER))
+    else:
+        query = db.query(Park)
+    if status:
+        query = query.filter(Park.status == status)
+    if equipment_ids:
+        query = query.filter(_has_equipment(equipment_ids, equipment_match))
+    return paginate(query, PARK_PAGE_ORDER, limit, skip=skip, cursor=cursor)
+
+
+def stream_parks(
+    db: Session,
+    status: Optional[str] = None,
+    batch_size: int = 1000,
+) -> Result:
+    """
+    Every park as plain rows, ordered by (created_at, id), fetched through a
+    server-side cursor ``batch_size`` rows at a time. Iterate the result (and
+    read ``keys()`` for the column names) while the session is open.
+    """
+    query = select(*PARK_FIELD_COLUMNS.values())
+    if status:
+        query = query.where(Park.status == status)
+    query = query.order_by(*PARK_PAGE_ORDER).execution_options(yield_per=batch_size)
+    return db.execute(query)
+
+
+def get_parks_version(db: Session) -> int:
+    """
+    Change counter of the parks (and park_equipment) tables, bumped by a
+    statement trigger on every write; a single-row primary key lookup.
+    """
+    return db.query(ParksVersion.version).filter(ParksVersion.id == 1).scalar() or 0
+
+
+def get_parks_by_ids(
+    db: Session,
+    park_ids: Sequence[UUID],
+    fields: Optional[Sequence[str]] = None,
+    status: Optional[str] = None,
+) -> List[Park]:
+    """
+    Parks with the given ids, in no particular order. With ``fields`` only
+    those columns (plus id) are selected and rows are returned instead of
+    Park objects.
+    """
+    if not park_ids:
+        return []
+    query = db.query(*_park_columns(fields, Park.id)) if fields else db.query(Park)
+    query = query.filter(Park.id.in_(park_ids))
     if status:
         query = query.filter(Park.status == status)
-    return query.offset(skip).limit(limit).all()
+    return query.all()
 
 
 def get_parks_by_status(db: Session, status: str) -> List[Park]:
@@ -60,6 +252,18 @@ def get_parks_by_status(db: Session, status: str) -> List[Park]:
     return db.query(Park).filter(Park.status == status).all()
 
 
+def get_parks_by_status_with_version(db: Session, status: str) -> Tuple[List[Park], int]:
+    """
+    All parks with ``status`` plus the ``parks_version`` they reflect, read in
+    one statement (one snapshot) so the version matches the rows exactly.
+    """
+    version = select(ParksVersion.version).where(ParksVersion.id == 1).scalar_subquery()
+    rows = db.query(Park, version).filter(Park.status == status).all()
+    if not rows:
+        return [], get_parks_version(db)
+    return [park for park, _ in rows], rows[0][1] or 0
+
+
 def get_parks_by_location(
     db: Session,
     min_latitude: Decimal,
@@ -67,21 +271,91 @@ def get_parks_by_location(
     min_longitude: Decimal,
     max_longitude: Decimal,
     status: Optional[str] = "approved",
+    fields: Optional[Sequence[str]] = None,
 ) -> List[Park]:
-    """Get parks within a geographic bounding box."""
-    query = db.query(Park).filter(
-        and_(
-            Park.latitude >= min_latitude,
-            Park.latitude <= max_latitude,
-            Park.longitude >= min_longitude,
-            Park.longitude <= max_longitude,
-        )
+    """
+    Get parks within a geographic bounding box.
+
+    With ``fields`` only those columns are selected and rows are returned
+    instead of Park objects; the location tile cache loads its tiles this way
+    (``ParkLocationCache.TILE_FIELDS``) and selects the requested response
+    columns afterwards with ``get_parks_by_ids``. The ``equipment=`` filter
+    of ``/location`` runs over the cached equipment ids in memory.
+    """
+    query = db.query(*_park_columns(fields)) if fields else db.query(Park)
+    query = query.filter(
+        _in_bounding_box(min_latitude, max_latitude, min_longitude, max_longitude)
     )
     if status:
         query = query.filter(Park.status == status)
     return query.all()
 
 
+def get_parks_by_location_delta(
+    db: Session,
+    bounding_box: Tuple[Decimal, Decimal, Decimal, Decimal],
+    previous_bounding_box: Tuple[Decimal, Decimal, Decimal, Decimal],
+    status: Optional[str] = "approved",
+) -> Tuple[List[Park], List[UUID]]:
+    """
+    Get the change between two bounding boxes.
+
+    Returns (parks inside bounding_box but not previous_bounding_box,
+    ids of parks inside previous_bounding_box but not bounding_box). Boxes are
+    (min_latitude, max_latitude, min_longitude, max_longitude).
+    """
+    current = _in_bounding_box(*bounding_box)
+    previous = _in_bounding_box(*previous_bounding_box)
+
+    added_query = db.query(Park).filter(current, ~previous)
+    removed_query = db.query(Park.id).filter(previous, ~current)
+    if status:
+        added_query = added_query.filter(Park.status == status)
+        removed_query = removed_query.filter(Park.status == status)
+    return added_query.all(), [row.id for row in removed_query.all()]
+
+
+def get_parks_by_locations(
+    db: Session,
+    bounding_boxes: List[Tuple[Decimal, Decimal, Decimal, Decimal]],
+    status: Optional[str] = "approved",
+) -> List[Tuple[int, Park]]:
+    """
+    Get parks for several bounding boxes in a single statement.
+
+    Each box is (min_latitude, max_latitude, min_longitude, max_longitude).
+    The boxes are joined as a VALUES list, so the result is one
+    (box index, Park) row per match; a park inside several boxes is the same
+    Park instance in each of its rows.
+    """
+    if not bounding_boxes:
+        return []
+    viewports = values(
+        column("idx", Integer),
+        column("min_lat", Numeric),
+        column("max_lat", Numeric),
+        column("min_lng", Numeric),
+        column("max_lng", Numeric),
+        name="viewports",
+    ).data([(idx, *box) for idx, box in enumerate(bounding_boxes)])
+    query = (
+        db.query(viewports.c.idx, Park)
+        .select_from(Park)
+        .join(
+            viewports,
+            and_(
+                Park.latitude >= viewports.c.min_lat,
+                Park.latitude <= viewports.c.max_lat,
+                Park.longitude >= viewports.c.min_lng,
+                Park.longitude <= viewports.c.max_lng,
+            ),
+        )
+    )
+    if status:
+        query = query.filter(Park.status == status)
+    return [(row[0], row[1]) for row in query.all()]
+
+
 def update_park(
     db: Session,
     park_id: UUID,
@@ -144,6 +418,13 @@ def get_park_submissions_paginated(
 ) -> Tuple[List[Park], int]:
     """
     Get park submissions with pagination, status filtering, and search.
+    The total is exact without a search and may be estimated with one.
+
+    Search matches name, address, or submitter name as a case-insensitive
+    substring. Each column has a pg_trgm GIN index (migration 007), and the
+    submitter match is a subquery rather than a join, so the OR is answered
+    by a bitmap OR of index scans. Results are ordered by relevance (best
+    word similarity of name, address or submitter name), then by submit date.
     """
     query = db.query(Park)
     
@@ -155,20 +436,43 @@ def get_park_submissions_paginated(
     if search:
         from models.database import User
         search_pattern = f"%{search}%"
-        query = query.outerjoin(User, Park.submitted_by == User.id).filter(
+        matching_submitters = select(User.id).where(User.name.ilike(search_pattern))
+        query = query.filter(
             or_(
                 Park.name.ilike(search_pattern),
                 Park.address.ilike(search_pattern),
-                User.name.ilike(search_pattern)
+                Park.submitted_by.in_(matching_submitters)
             )
         )
     
-    # Get total count before pagination
-    total_count = query.count()
+    # Totals: trigger-maintained per-status counts without a search; with a
+    # search, the planner's estimate, counted exactly only when it is small.
+    if not search:
+        total_count = get_park_status_count(db, None if status == "all" else status)
+    else:
+        total_count = estimate_row_count(db, query)
+        if total_count < EXACT_SEARCH_COUNT_THRESHOLD:
+            total_count = query.count()
     
     # Apply pagination
     skip = (page - 1) * page_size
-    parks = query.order_by(Park.submit_date.desc()).offset(skip).limit(page_size).all()
+    if search:
+        from models.database import User
+        # Correlated per result row on the users primary key, only for ordering.
+        submitter_similarity = (
+            select(func.word_similarity(search, User.name))
+            .where(User.id == Park.submitted_by)
+            .scalar_subquery()
+        )
+        relevance = func.greatest(
+            func.word_similarity(search, Park.name),
+            func.word_similarity(search, func.coalesce(Park.address, "")),
+            func.coalesce(submitter_similarity, 0),
+        )
+        query = query.order_by(relevance.desc(), Park.submit_date.desc())
+    else:
+        query = query.order_by(Park.submit_date.desc())
+    parks = query.offset(skip).limit(page_size).all()
     
     return parks, total_count
 
@@ -3,9 +3,13 @@ CRUD operations for Users table.
 """
 
 from sqlalchemy.orm import Session
-from typing import Optional, List
+from typing import Dict, Optional, List, Sequence, Tuple
 from uuid import UUID
 from models.database import User
+from .Pagination import paginate
+
+# users has no timestamps; the primary key alone is a unique, indexed order.
+USER_PAGE_ORDER = (User.id,)
 
 
 def create_user(
@@ -43,13 +47,40 @@ def get_user_by_auth0_id(db: Session, auth0_id: str) -> Optional[User]:
     return db.query(User).filter(User.auth0_id == auth0_id).first()
 
 
+def get_user_names(db: Session, user_ids: Sequence[UUID]) -> Dict[UUID, str]:
+    """Names for several users in one query, keyed by user ID."""
+    if not user_ids:
+        return {}
+    rows = db.query(User.id, User.name).filter(User.id.in_(user_ids)).all()
+    return {user_id: name for user_id, name in rows}
+
+
 def get_all_users(
     db: Session,
     skip: int = 0,
     limit: int = 100,
 ) -> List[User]:
     """Get all users with pagination."""
-    return db.query(User).offset(skip).limit(limit).all()
+    users, _ = get_users_page(db, skip=skip, limit=limit)
+    return users
+
+
+def get_users_page(
+    db: Session,
+    skip: int = 0,
+    limit: int = 100,
+    cursor: Optional[str] = None,
+    fields: Optional[Sequence[str]] = None,
+) -> Tuple[List[User], Optional[str]]:
+    """
+    Get one page of users ordered by id and the cursor for the next page.
+    Raises ValueError for a malformed cursor.
+
+    With ``fields`` only those columns are selected and plain rows are
+    returned instead of User objects.
+    """
+    query = db.query(*(getattr(User, field) for field in fields)) if fields else db.query(User)
+    return paginate(query, USER_PAGE_ORDER, limit, skip=skip, cursor=cursor)
 
 
 def update_user(
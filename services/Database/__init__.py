@@ -7,21 +7,37 @@ from .PostgresConnection import (
     Base,
     get_db,
 )
+from .Pagination import (
+    encode_cursor,
+    decode_cursor,
+    paginate,
+    estimate_row_count,
+)
 from .UsersTable import (
     create_user,
     get_user,
     get_user_by_email,
     get_user_by_auth0_id,
+    get_user_names,
     get_all_users,
+    get_users_page,
     update_user,
     delete_user,
 )
 from .ParksTable import (
     create_park,
+    create_park_submission,
     get_park,
     get_all_parks,
+    get_parks_page,
+    stream_parks,
+    get_parks_version,
     get_parks_by_status,
+    get_parks_by_status_with_version,
+    get_parks_by_ids,
     get_parks_by_location,
+    get_parks_by_locations,
+    get_parks_by_location_delta,
     update_park,
     delete_park,
     get_park_submissions_paginated,
@@ -30,8 +46,11 @@ from .ParksTable import (
 from .EquipmentTable import (
     create_equipment,
     get_equipment,
+    get_existing_equipment_ids,
     get_equipment_by_name,
     get_all_equipment,
+    get_equipment_page,
+    get_equipment_version,
     update_equipment,
     delete_equipment,
 )
@@ -39,6 +58,7 @@ from .ImagesTable import (
     create_image,
     get_image,
     get_images_by_park,
+    get_image_urls_by_parks,
     get_primary_image,
     update_image,
     delete_image,
@@ -57,13 +77,26 @@ from .ParkEquipmentTable import (
     remove_equipment_from_park,
     get_park_equipment,
     get_equipment_by_park,
+    get_equipment_names_by_parks,
     get_parks_by_equipment,
     remove_all_equipment_from_park,
 )
+from .ParkStatusCountsTable import (
+    get_park_status_counts,
+    get_park_status_count,
+)
+from .ImageUploadJobsTable import (
+    claim_image_upload_jobs,
+    complete_image_upload_job,
+    retry_image_upload_job,
+    fail_image_upload_job,
+    get_image_upload_jobs_by_park,
+)
 from .EventsTable import (
     get_events,
     create_event,
     get_event,
+    stream_events,
 )
 
 __all__ = [
@@ -72,20 +105,35 @@ __all__ = [
     "SessionLocal",
     "Base",
     "get_db",
+    # Pagination
+    "encode_cursor",
+    "decode_cursor",
+    "paginate",
+    "estimate_row_count",
     # Users
     "create_user",
     "get_user",
     "get_user_by_email",
     "get_user_by_auth0_id",
+    "get_user_names",
     "get_all_users",
+    "get_users_page",
     "update_user",
     "delete_user",
     # Parks
     "create_park",
+    "create_park_submission",
     "get_park",
     "get_all_parks",
+    "get_parks_page",
+    "stream_parks",
+    "get_parks_version",
     "get_parks_by_status",
+    "get_parks_by_status_with_version",
+    "get_parks_by_ids",
     "get_parks_by_location",
+    "get_parks_by_locations",
+    "get_parks_by_location_delta",
     "update_park",
     "delete_park",
     "get_park_submissions_paginated",
@@ -93,14 +141,18 @@ __all__ = [
     # Equipment
     "create_equipment",
     "get_equipment",
+    "get_existing_equipment_ids",
     "get_equipment_by_name",
     "get_all_equipment",
+    "get_equipment_page",
+    "get_equipment_version",
     "update_equipment",
     "delete_equipment",
     # Images
     "create_image",
     "get_image",
     "get_images_by_park",
+    "get_image_urls_by_parks",
     "get_primary_image",
     "update_image",
     "delete_image",
@@ -117,10 +169,21 @@ __all__ = [
     "remove_equipment_from_park",
     "get_park_equipment",
     "get_equipment_by_park",
+    "get_equipment_names_by_parks",
     "get_parks_by_equipment",
     "remove_all_equipment_from_park",
+    # Park status counts
+    "get_park_status_counts",
+    "get_park_status_count",
+    # Image upload jobs
+    "claim_image_upload_jobs",
+    "complete_image_upload_job",
+    "retry_image_upload_job",
+    "fail_image_upload_job",
+    "get_image_upload_jobs_by_park",
     # Events
     "get_events",
     "create_event",
     "get_event",
+    "stream_events",
 ]
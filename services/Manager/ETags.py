@@ -0,0 +1,67 @@
+"""
+Weak ETags for list endpoints.
+
+An ETag is derived from a table's change marker (see ``get_parks_version`` /
+``get_equipment_version``) plus the request variant (query string and the
+negotiated representation), so a matching ``If-None-Match`` can be answered
+with 304 before the list query or serialization runs. The parks marker is a
+trigger-maintained counter (one row); approved-park viewports, which are
+served from the in-memory ``park_index``, use the counter value the index
+recorded and need no query at all.
+"""
+import hashlib
+
+from fastapi import Request
+from sqlalchemy.orm import Session
+
+from services.Database import get_equipment_version, get_parks_version
+from services.Manager.ParkIndex import INDEXED_STATUS, park_index
+
+
+def weak_etag(*parts) -> str:
+    """Build a weak ETag from arbitrary (str()-able) parts."""
+    digest = hashlib.blake2b(
+        "\x1f".join(str(part) for part in parts).encode(), digest_size=12
+    ).hexdigest()
+    return f'W/"{digest}"'
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """Weak comparison of an If-None-Match header against ``etag``."""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    opaque = etag.removeprefix("W/")
+    return any(
+        candidate.strip().removeprefix("W/") == opaque
+        for candidate in if_none_match.split(",")
+    )
+
+
+def _variant(request: Request, representation: str) -> str:
+    return f"{request.url.path}?{sorted(request.query_params.multi_items())}#{representation}"
+
+
+def get_parks_etag(db: Session, request: Request, representation: str = "json") -> str:
+    """ETag for a parks list response."""
+    return weak_etag("parks", get_parks_version(db), _variant(request, representation))
+
+
+def get_parks_location_etag(
+    db: Session,
+    request: Request,
+    status: str | None,
+    representation: str = "json",
+) -> str:
+    """ETag for a bounding box response; approved parks use the index's parks_version."""
+    if status != INDEXED_STATUS:
+        return get_parks_etag(db, request, representation)
+    park_index.ensure_loaded(db)
+    # Workers whose index reflects the same version agree on the ETag.
+    return weak_etag("parks", park_index.version, _variant(request, representation))
+
+
+def get_equipment_etag(db: Session, request: Request, representation: str = "json") -> str:
+    """ETag for an equipment list response."""
+    return weak_etag("equipment", get_equipment_version(db), _variant(request, representation))
@@ -1,16 +1,44 @@
 """
-Equipment list business logic.
+Equipment list and delete business logic.
 """
+from uuid import UUID
+
+from fastapi import HTTPException
 from sqlalchemy.orm import Session
 
 from models.responses.EquipmentResponses import EquipmentResponse
-from services.Database import get_all_equipment
+from services.Database import delete_equipment, get_equipment_page, get_parks_by_equipment
+from services.Manager.FastJSON import rows_to_dicts
+from services.Manager.Parks import notify_parks_changed
 
 
 def get_all_equipment_types(
     db: Session,
     skip: int = 0,
     limit: int = 100,
-) -> list[EquipmentResponse]:
-    """Get all equipment types."""
-    return get_all_equipment(db, skip=skip, limit=limit)
+    cursor: str | None = None,
+) -> tuple[list[dict], str | None]:
+    """
+    Get one page of equipment types as plain dicts (EquipmentResponse fields),
+    plus the cursor for the next page. ``cursor`` takes precedence over ``skip``.
+    """
+    try:
+        rows, next_cursor = get_equipment_page(
+            db, skip=skip, limit=limit, cursor=cursor, fields=list(EquipmentResponse.model_fields)
+        )
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    return rows_to_dicts(rows), next_cursor
+
+
+def delete_equipment_type(db: Session, equipment_id: UUID) -> bool:
+    """
+    Delete an equipment type. It is also removed from every park's
+    ``equipment_ids``, so the in-memory views of those parks are refreshed.
+    Returns False if it does not exist.
+    """
+    park_ids = [park.id for park in get_parks_by_equipment(db, equipment_id)]
+    deleted = delete_equipment(db, equipment_id)
+    if deleted and park_ids:
+        notify_parks_changed(db, park_ids)
+    return deleted
@@ -8,7 +8,7 @@ from fastapi import HTTPException
 from sqlalchemy.orm import Session
 
 from models.responses.EventsResponses import EventResponse, EventsListResponse
-from services.Database.EventsTable import get_events, haversine_distance
+from services.Database.EventsTable import get_events
 
 
 def format_distance(distance_miles: float) -> str:
@@ -57,18 +57,12 @@ def get_events_feed(
     )
 
     event_responses = []
-    for event in events:
+    for event, distance_miles in events:
         if not event.park:
             continue
 
         distance_str = None
-        if lat is not None and lng is not None:
-            distance_miles = haversine_distance(
-                lat,
-                lng,
-                float(event.park.latitude),
-                float(event.park.longitude),
-            )
+        if distance_miles is not None:
             distance_str = format_distance(distance_miles)
 
         date_str = None
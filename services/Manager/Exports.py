@@ -0,0 +1,126 @@
+"""
+Streaming NDJSON / CSV exports of whole tables.
+
+Rows come from a server-side cursor and are encoded and (optionally) gzipped
+as they arrive, so memory stays flat however large the table is. Each export
+opens its own session: the request-scoped ``get_db`` session is closed before
+a ``StreamingResponse`` body is sent.
+"""
+import csv
+import io
+import json
+import zlib
+from datetime import date, datetime, time
+from decimal import Decimal
+from typing import Callable, Iterable, Iterator, Optional
+from uuid import UUID
+
+from sqlalchemy.engine import Result
+from sqlalchemy.orm import Session
+
+from services.Database import SessionLocal, stream_events, stream_parks
+
+EXPORT_MEDIA_TYPES = {"ndjson": "application/x-ndjson", "csv": "text/csv"}
+EXPORT_BATCH_SIZE = 1000
+# Encoded output is flushed to the client in chunks of about this size.
+EXPORT_CHUNK_BYTES = 64 * 1024
+
+
+def accepts_encoding(accept_encoding: Optional[str], coding: str) -> bool:
+    """True when an Accept-Encoding header allows ``coding`` (and does not set q=0)."""
+    for part in (accept_encoding or "").split(","):
+        name, *params = part.split(";")
+        if name.strip().lower() != coding:
+            continue
+        quality = 1.0
+        for param in params:
+            key, _, value = param.partition("=")
+            if key.strip().lower() == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        return quality > 0
+    return False
+
+
+def accepts_gzip(accept_encoding: Optional[str]) -> bool:
+    """True when an Accept-Encoding header allows gzip."""
+    return accepts_encoding(accept_encoding, "gzip")
+
+
+def _plain(value):
+    """Export representation of a column value."""
+    if isinstance(value, (datetime, date, time)):
+        return value.isoformat()
+    if isinstance(value, UUID):
+        return str(value)
+    if isinstance(value, Decimal):
+        return float(value)
+    if isinstance(value, (list, tuple)):
+        return [_plain(item) for item in value]
+    return value
+
+
+def _ndjson_lines(result: Result) -> Iterator[str]:
+    keys = list(result.keys())
+    for row in result:
+        yield json.dumps({key: _plain(value) for key, value in zip(keys, row)}) + "\n"
+
+
+def _csv_lines(result: Result) -> Iterator[str]:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(result.keys())
+    for row in result:
+        values = (_plain(value) for value in row)
+        writer.writerow(";".join(value) if isinstance(value, list) else value for value in values)
+        yield buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate()
+    yield buffer.getvalue()
+
+
+def _chunks(lines: Iterable[str], compress: bool) -> Iterator[bytes]:
+    compressor = zlib.compressobj(wbits=zlib.MAX_WBITS | 16) if compress else None
+    pending: list[bytes] = []
+    size = 0
+    for line in lines:
+        data = line.encode("utf-8")
+        pending.append(data)
+        size += len(data)
+        if size < EXPORT_CHUNK_BYTES:
+            continue
+        chunk = b"".join(pending)
+        pending, size = [], 0
+        if compressor is not None:
+            chunk = compressor.compress(chunk)
+        if chunk:
+            yield chunk
+    chunk = b"".join(pending)
+    if compressor is not None:
+        chunk = compressor.compress(chunk) + compressor.flush()
+    if chunk:
+        yield chunk
+
+
+def _stream(open_rows: Callable[[Session], Result], fmt: str, compress: bool) -> Iterator[bytes]:
+    db = SessionLocal()
+    try:
+        result = open_rows(db)
+        lines = _csv_lines(result) if fmt == "csv" else _ndjson_lines(result)
+        yield from _chunks(lines, compress)
+    finally:
+        db.close()
+
+
+def stream_parks_export(fmt: str = "ndjson", status: Optional[str] = None, compress: bool = False) -> Iterator[bytes]:
+    """Encoded chunks of every park (optionally one status)."""
+    return _stream(
+        lambda db: stream_parks(db, status=status, batch_size=EXPORT_BATCH_SIZE), fmt, compress
+    )
+
+
+def stream_events_export(fmt: str = "ndjson", compress: bool = False) -> Iterator[bytes]:
+    """Encoded chunks of every event."""
+    return _stream(lambda db: stream_events(db, batch_size=EXPORT_BATCH_SIZE), fmt, compress)
@@ -0,0 +1,38 @@
+"""
+Fast JSON path for list endpoints.
+
+List endpoints select plain Core rows (no ORM hydration) and encode them with
+orjson in ``FastJSONResponse``, bypassing FastAPI's ``response_model``
+validation. The output matches what the Pydantic response models produce
+(UUIDs as strings, ISO-8601 datetimes with ``Z`` for UTC, Decimals as floats),
+so ``response_model`` still documents the payload.
+"""
+from decimal import Decimal
+from typing import Any, Iterable
+
+import orjson
+from fastapi.responses import JSONResponse
+
+
+def _default(value: Any):
+    if isinstance(value, Decimal):
+        return float(value)
+    if isinstance(value, tuple):
+        return list(value)
+    raise TypeError(f"Type is not JSON serializable: {type(value).__name__}")
+
+
+class FastJSONResponse(JSONResponse):
+    """JSONResponse rendered with orjson."""
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(
+            content,
+            default=_default,
+            option=orjson.OPT_UTC_Z | orjson.OPT_NON_STR_KEYS,
+        )
+
+
+def rows_to_dicts(rows: Iterable) -> list[dict]:
+    """Core result rows to plain dicts keyed by column name."""
+    return [row._asdict() for row in rows]
@@ -0,0 +1,84 @@
+"""
+Vectorized geo kernels for in-process park queries.
+
+The in-memory indexes keep park coordinates in float64 NumPy arrays (one
+block per grid cell or tile) and run these kernels over a whole block at
+once, instead of calling the scalar ``math`` helpers once per park. Database
+queries compute distances in SQL instead (see ``haversine_distance_sql``).
+"""
+from typing import Sequence
+
+import numpy as np
+
+EARTH_RADIUS_MILES = 3958.8
+MAX_MERCATOR_LATITUDE = 85.05112878
+# Largest float64 below 1.0, so projected coordinates stay inside [0, 1).
+_BELOW_ONE = np.nextafter(1.0, 0.0)
+
+
+class CoordinateBlock:
+    """Items with their latitudes and longitudes as parallel float64 arrays."""
+
+    __slots__ = ("items", "latitudes", "longitudes")
+
+    def __init__(self, items: Sequence, latitudes: np.ndarray, longitudes: np.ndarray):
+        self.items = items
+        self.latitudes = latitudes
+        self.longitudes = longitudes
+
+    @classmethod
+    def of(cls, records: Sequence) -> "CoordinateBlock":
+        """Block over records exposing float ``latitude`` / ``longitude``."""
+        records = list(records)
+        latitudes = np.fromiter((record.latitude for record in records), np.float64, len(records))
+        longitudes = np.fromiter((record.longitude for record in records), np.float64, len(records))
+        return cls(records, latitudes, longitudes)
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    def select(self, mask: np.ndarray) -> list:
+        """Items where ``mask`` is true, in block order."""
+        return [self.items[i] for i in np.flatnonzero(mask)]
+
+
+def haversine_miles(
+    latitude: float,
+    longitude: float,
+    latitudes: np.ndarray,
+    longitudes: np.ndarray,
+) -> np.ndarray:
+    """Great-circle distance (miles) from one point to every point of the arrays."""
+    lat1 = np.radians(latitude)
+    lat2 = np.radians(latitudes)
+    a = (
+        np.sin((lat2 - lat1) / 2) ** 2
+        + np.cos(lat1) * np.cos(lat2) * np.sin(np.radians(longitudes - longitude) / 2) ** 2
+    )
+    return 2 * EARTH_RADIUS_MILES * np.arcsin(np.sqrt(np.minimum(a, 1.0)))
+
+
+def within_bounds(
+    latitudes: np.ndarray,
+    longitudes: np.ndarray,
+    min_latitude: float,
+    max_latitude: float,
+    min_longitude: float,
+    max_longitude: float,
+) -> np.ndarray:
+    """Boolean mask of the points inside the (inclusive) bounding box."""
+    return (
+        (latitudes >= min_latitude)
+        & (latitudes <= max_latitude)
+        & (longitudes >= min_longitude)
+        & (longitudes <= max_longitude)
+    )
+
+
+def mercator(latitudes: np.ndarray, longitudes: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Project to normalized Web Mercator coordinates in ``[0, 1)``."""
+    latitudes = np.clip(latitudes, -MAX_MERCATOR_LATITUDE, MAX_MERCATOR_LATITUDE)
+    x = (longitudes + 180.0) / 360.0
+    sin_lat = np.sin(np.radians(latitudes))
+    y = 0.5 - np.log((1 + sin_lat) / (1 - sin_lat)) / (4 * np.pi)
+    return np.clip(x, 0.0, _BELOW_ONE), np.clip(y, 0.0, _BELOW_ONE)
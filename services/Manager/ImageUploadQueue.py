@@ -0,0 +1,288 @@
+"""
+Durable queue for the image uploads of asynchronous park submissions.
+
+The submission request copies each image to ``UPLOAD_STAGING_DIR`` and
+queues one ``image_upload_jobs`` row per image, then returns. A worker loop
+started from the app lifespan claims due jobs (``FOR UPDATE SKIP LOCKED``, so
+every app process can run one), uploads at most ``UPLOAD_CONCURRENCY`` images
+at a time and retries failures with exponential backoff up to the job's
+``max_attempts``. Jobs of a worker that died are reclaimed once their lease
+(``UPLOAD_LEASE_SECONDS``) expires; the claim's ``attempts`` fences the
+original worker out, and an image it uploads after that (or after the park
+was deleted) is removed from Cloudflare again. When several processes run
+workers the staging directory must be shared between them.
+"""
+import asyncio
+import logging
+import os
+import shutil
+import tempfile
+from typing import Iterable, Optional
+from uuid import UUID
+
+from fastapi import HTTPException
+from sqlalchemy.engine import Row
+from sqlalchemy.orm import Session
+
+from models.requests.ParkSubmissionRequest import ImageSubmission
+from models.responses.ParkSubmissionResponse import (
+    ImageUploadStatus,
+    ParkSubmissionStatusResponse,
+)
+from services.Adapters.CloudflareAdapter import delete_image, is_configured, upload_single_image
+from services.Database import (
+    SessionLocal,
+    claim_image_upload_jobs,
+    complete_image_upload_job,
+    fail_image_upload_job,
+    get_image_upload_jobs_by_park,
+    get_park,
+    retry_image_upload_job,
+)
+
+logger = logging.getLogger(__name__)
+
+UPLOAD_STAGING_DIR = os.getenv(
+    "IMAGE_UPLOAD_STAGING_DIR", os.path.join(tempfile.gettempdir(), "barzmap-image-uploads")
+)
+UPLOAD_WORKER_ENABLED = os.getenv("IMAGE_UPLOAD_WORKER_ENABLED", "true").lower() != "false"
+UPLOAD_CONCURRENCY = int(os.getenv("IMAGE_UPLOAD_CONCURRENCY", "4"))
+UPLOAD_POLL_SECONDS = float(os.getenv("IMAGE_UPLOAD_POLL_SECONDS", "2"))
+UPLOAD_LEASE_SECONDS = 300.0
+RETRY_BASE_SECONDS = 5.0
+RETRY_MAX_SECONDS = 600.0
+# How long shutdown waits for in-flight uploads before cancelling them.
+STOP_GRACE_SECONDS = 10.0
+# Upload errors that another attempt cannot fix.
+PERMANENT_ERRORS = {"Invalid input"}
+_COPY_CHUNK_BYTES = 64 * 1024
+
+
+def stage_image(image: ImageSubmission) -> str:
+    """Copy an upload into the staging directory (chunked); returns its path."""
+    os.makedirs(UPLOAD_STAGING_DIR, exist_ok=True)
+    image.file.seek(0)
+    fd, path = tempfile.mkstemp(dir=UPLOAD_STAGING_DIR, suffix=".upload")
+    try:
+        with os.fdopen(fd, "wb") as staged:
+            shutil.copyfileobj(image.file, staged, _COPY_CHUNK_BYTES)
+    except BaseException:
+        os.unlink(path)
+        raise
+    return path
+
+
+def discard_staged_images(paths: Iterable[str]) -> None:
+    for path in paths:
+        try:
+            os.unlink(path)
+        except FileNotFoundError:
+            pass
+
+
+def _retry_delay(attempts: int) -> float:
+    return min(RETRY_BASE_SECONDS * 2 ** (attempts - 1), RETRY_MAX_SECONDS)
+
+
+class ImageUploadWorker:
+    """Claims and uploads queued images in the background of one app process."""
+
+    def __init__(
+        self,
+        concurrency: int = UPLOAD_CONCURRENCY,
+        poll_seconds: float = UPLOAD_POLL_SECONDS,
+    ):
+        self.concurrency = concurrency
+        self.poll_seconds = poll_seconds
+        self._wake: Optional[asyncio.Event] = None
+        self._stopping = False
+        self._loop_task: Optional[asyncio.Task] = None
+        self._tasks: set[asyncio.Task] = set()
+
+    def start(self) -> None:
+        if self._loop_task is None:
+            self._stopping = False
+            # Created here so the event belongs to the running loop.
+            self._wake = asyncio.Event()
+            self._loop_task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop claiming, let in-flight uploads finish briefly, then cancel them."""
+        if self._loop_task is None:
+            return
+        self._stopping = True
+        self._wake.set()
+        await self._loop_task
+        self._loop_task = None
+        if self._tasks:
+            _, pending = await asyncio.wait(self._tasks, timeout=STOP_GRACE_SECONDS)
+            # Cancelled jobs stay running and are reclaimed after their lease.
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+
+    def wake(self) -> None:
+        """Check for due jobs now instead of at the next poll."""
+        if self._wake is not None:
+            self._wake.set()
+
+    async def _run(self) -> None:
+        while not self._stopping:
+            free = self.concurrency - len(self._tasks)
+            if free > 0:
+                try:
+                    jobs = await asyncio.to_thread(self._claim, free)
+                except Exception:
+                    logger.exception("Failed to claim image upload jobs")
+                    jobs = []
+                for job in jobs:
+                    task = asyncio.create_task(self._process(job))
+                    self._tasks.add(task)
+                    task.add_done_callback(self._task_done)
+            try:
+                await asyncio.wait_for(self._wake.wait(), timeout=self.poll_seconds)
+            except asyncio.TimeoutError:
+                pass
+            self._wake.clear()
+
+    def _task_done(self, task: asyncio.Task) -> None:
+        self._tasks.discard(task)
+        # A slot is free: claim the next job without waiting for the poll.
+        self.wake()
+
+    @staticmethod
+    def _claim(limit: int) -> list[Row]:
+        db = SessionLocal()
+        try:
+            return claim_image_upload_jobs(db, limit, UPLOAD_LEASE_SECONDS)
+        finally:
+            db.close()
+
+    async def _process(self, job: Row) -> None:
+        try:
+            error_kind, message, uploaded = await self._upload(job)
+            recorded = await asyncio.to_thread(self._finish, job, error_kind, message, uploaded)
+            if uploaded is not None and not recorded:
+                # Fenced out or the park was deleted: do not leave an orphan behind.
+                logger.info("Image upload job %s no longer held; deleting image %s", job.id, uploaded.id)
+                await delete_image(uploaded.id)
+        except Exception:
+            logger.exception("Image upload job %s failed unexpectedly", job.id)
+
+    @staticmethod
+    async def _upload(job: Row) -> tuple[Optional[str], Optional[str], object]:
+        """Upload a job's staged file: (error kind, message, uploaded image)."""
+        if job.attempts > job.max_attempts:
+            return "Invalid input", "Gave up after repeated worker failures", None
+        if not is_configured():
+            return "Unavailable", "Image upload service missing configuration", None
+        try:
+            staged = open(job.file_path, "rb")
+        except FileNotFoundError:
+            return "Invalid input", "Staged image file is missing", None
+        with staged:
+            size = os.fstat(staged.fileno()).st_size
+            result = await upload_single_image(
+                job.position, ImageSubmission(file=staged, size=size, alt_text=job.alt_text)
+            )
+        if result.error is not None:
+            return result.error.error, result.error.message, None
+        if not result.uploaded_image.variants:
+            return "Invalid input", "Cloudflare returned no image variants", None
+        return None, None, result.uploaded_image
+
+    @staticmethod
+    def _finish(job: Row, error_kind: Optional[str], message: Optional[str], uploaded) -> bool:
+        """
+        Record the outcome under the job's claim. Returns False when the claim
+        no longer holds (the staged file then belongs to the new owner, or is
+        already gone with the park).
+        """
+        db = SessionLocal()
+        try:
+            if uploaded is not None:
+                variants = uploaded.variants
+                image = complete_image_upload_job(
+                    db,
+                    job.id,
+                    job.park_id,
+                    job.attempts,
+                    image_url=variants[0],
+                    thumbnail_url=variants[-1] if len(variants) > 1 else None,
+                    alt_text=job.alt_text,
+                    uploaded_by=job.uploaded_by,
+                    is_primary=(job.position == 0),
+                )
+                if image is None:
+                    return False
+                discard_staged_images([job.file_path])
+                return True
+
+            error = f"{error_kind}: {message}"
+            if error_kind in PERMANENT_ERRORS or job.attempts >= job.max_attempts:
+                logger.warning("Image upload job %s failed: %s", job.id, error)
+                if not fail_image_upload_job(db, job.id, job.park_id, job.attempts, error):
+                    return False
+                discard_staged_images([job.file_path])
+                return True
+            delay = _retry_delay(job.attempts)
+            logger.info("Image upload job %s retrying in %ss: %s", job.id, delay, error)
+            return retry_image_upload_job(db, job.id, job.park_id, job.attempts, error, delay)
+        finally:
+            db.close()
+
+
+image_upload_worker = ImageUploadWorker()
+
+
+def stage_submission_images(
+    images: list[ImageSubmission],
+    uploaded_by: Optional[UUID] = None,
+) -> list[dict]:
+    """
+    Stage a submission's images; returns the upload job values to insert with
+    the park (see ``create_park_submission``). Call ``discard_staged_images``
+    on their ``file_path`` if the park is not created.
+    """
+    paths: list[str] = []
+    try:
+        for image in images:
+            paths.append(stage_image(image))
+    except BaseException:
+        discard_staged_images(paths)
+        raise
+    return [
+        {
+            "position": position,
+            "file_path": path,
+            "alt_text": image.alt_text,
+            "uploaded_by": uploaded_by,
+        }
+        for position, (image, path) in enumerate(zip(images, paths))
+    ]
+
+
+def discard_queued_images(db: Session, park_id: UUID) -> None:
+    """Remove the staged files of a park's unfinished jobs (before deleting the park)."""
+    discard_staged_images(
+        job.file_path
+        for job in get_image_upload_jobs_by_park(db, park_id)
+        if job.status in ("queued", "running")
+    )
+
+
+def get_submission_status(db: Session, park_id: UUID) -> ParkSubmissionStatusResponse:
+    """Image upload progress of a submission. Raises HTTPException if the park does not exist."""
+    park = get_park(db, park_id)
+    if not park:
+        raise HTTPException(status_code=404, detail="Park submission not found")
+    jobs = get_image_upload_jobs_by_park(db, park_id)
+    return ParkSubmissionStatusResponse(
+        submission_id=park.id,
+        status=park.status,
+        image_status=park.image_status,
+        images_total=len(jobs),
+        images_uploaded=sum(1 for job in jobs if job.status == "done"),
+        images_failed=sum(1 for job in jobs if job.status == "failed"),
+        images=[ImageUploadStatus.model_validate(job) for job in jobs],
+    )
@@ -6,7 +6,9 @@ from uuid import UUID
 
 from sqlalchemy.orm import Session
 
+from models.responses.CloudflareImageResponses import CloudflarePoolStatsResponse
 from models.responses.ImagesResponses import ImageResponse
+from services.Adapters.CloudflareAdapter import get_pool_stats
 from services.Database import get_images_by_park
 
 
@@ -23,3 +25,8 @@ def get_images_for_park(
         is_approved=is_approved,
         is_primary=is_primary,
     )
+
+
+def get_cloudflare_pool_stats() -> CloudflarePoolStatsResponse:
+    """Utilisation of the shared Cloudflare connection pool."""
+    return CloudflarePoolStatsResponse(**get_pool_stats())
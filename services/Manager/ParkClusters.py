@@ -0,0 +1,265 @@
+"""
+Hierarchical clustering of approved parks for slippy-map tiles.
+
+Parks are projected to Web Mercator and bucketed into a quadtree of grid cells
+(``CLUSTER_GRID`` x ``CLUSTER_GRID`` cells per tile). The finest level is built
+from the in-memory park index and every coarser level is the sum of its four
+children, so a tile below ``INDIVIDUAL_PARKS_ZOOM`` is answered from at most
+``CLUSTER_GRID ** 2`` cell lookups. At ``INDIVIDUAL_PARKS_ZOOM`` and above the
+tile lists individual parks. Rendered tiles are cached and a park change only
+evicts the tiles that contain the park's old or new position. Projection runs
+through the vectorized ``GeoKernels.mercator``, for single points too, so a
+park always lands in the same cell whichever path placed it.
+"""
+import math
+import threading
+from collections import OrderedDict
+from typing import Optional
+from uuid import UUID
+
+import numpy as np
+
+from fastapi import HTTPException
+from sqlalchemy.orm import Session
+
+from models.database import Park
+from models.responses.ParksResponses import (
+    ParkClusterResponse,
+    ParkPinResponse,
+    ParkTileResponse,
+)
+from services.Manager.GeoKernels import CoordinateBlock, mercator
+from services.Manager.ParkIndex import INDEXED_STATUS, park_index
+
+CLUSTER_GRID = 8
+INDIVIDUAL_PARKS_ZOOM = 14
+MAX_TILE_ZOOM = 22
+MAX_CACHED_TILES = 4096
+_FINEST_LEVEL = INDIVIDUAL_PARKS_ZOOM - 1
+_FINEST_SCALE = 2 ** _FINEST_LEVEL * CLUSTER_GRID
+
+
+def _mercator(latitude: float, longitude: float) -> tuple[float, float]:
+    """Project one point to normalized Web Mercator coordinates in ``[0, 1)``."""
+    mx, my = mercator(np.array([latitude]), np.array([longitude]))
+    return float(mx[0]), float(my[0])
+
+
+def _tile_bounds(z: int, x: int, y: int) -> tuple[float, float, float, float]:
+    """(min_lat, max_lat, min_lng, max_lng) covered by a tile."""
+    n = 2 ** z
+
+    def lat(row: int) -> float:
+        return math.degrees(math.atan(math.sinh(math.pi * (1 - 2 * row / n))))
+
+    return lat(y + 1), lat(y), x / n * 360.0 - 180.0, (x + 1) / n * 360.0 - 180.0
+
+
+def _tiles_containing(latitude: float, longitude: float) -> list[tuple[int, int, int]]:
+    mx, my = _mercator(latitude, longitude)
+    return [(z, int(mx * 2 ** z), int(my * 2 ** z)) for z in range(MAX_TILE_ZOOM + 1)]
+
+
+class _Cell:
+    __slots__ = ("count", "sum_latitude", "sum_longitude", "ids")
+
+    def __init__(self):
+        self.count = 0
+        self.sum_latitude = 0.0
+        self.sum_longitude = 0.0
+        self.ids: Optional[set[UUID]] = None
+
+
+class ParkClusterIndex:
+    """Per-zoom cluster cells derived from ``park_index``."""
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        # _levels[z][(cx, cy)] for z in 0.._FINEST_LEVEL
+        self._levels: list[dict[tuple[int, int], _Cell]] = []
+        self._points: dict[UUID, tuple[float, float, tuple[int, int]]] = {}
+        self._tiles: OrderedDict[tuple[int, int, int], ParkTileResponse] = OrderedDict()
+        self._generation: Optional[int] = None
+
+    def ensure_built(self, db: Session) -> None:
+        """Build from the park index, or rebuild if the index was reloaded."""
+        park_index.ensure_loaded(db)
+        if self._generation != park_index.generation:
+            self.rebuild()
+
+    def rebuild(self) -> None:
+        with self._lock:
+            generation = park_index.generation
+            finest: dict[tuple[int, int], _Cell] = {}
+            points: dict[UUID, tuple[float, float, tuple[int, int]]] = {}
+            block = CoordinateBlock.of(park_index.records())
+            mx, my = mercator(block.latitudes, block.longitudes)
+            cxs = (mx * _FINEST_SCALE).astype(np.int64).tolist()
+            cys = (my * _FINEST_SCALE).astype(np.int64).tolist()
+            for record, cx, cy in zip(block.items, cxs, cys):
+                key = (cx, cy)
+                cell = finest.get(key)
+                if cell is None:
+                    cell = finest[key] = _Cell()
+                    cell.ids = set()
+                cell.count += 1
+                cell.sum_latitude += record.latitude
+                cell.sum_longitude += record.longitude
+                cell.ids.add(record.id)
+                points[record.id] = (record.latitude, record.longitude, key)
+
+            levels = [finest]
+            for _ in range(_FINEST_LEVEL):
+                parents: dict[tuple[int, int], _Cell] = {}
+                for (cx, cy), child in levels[-1].items():
+                    parent = parents.get((cx >> 1, cy >> 1))
+                    if parent is None:
+                        parent = parents[(cx >> 1, cy >> 1)] = _Cell()
+                    parent.count += child.count
+                    parent.sum_latitude += child.sum_latitude
+                    parent.sum_longitude += child.sum_longitude
+                levels.append(parents)
+            levels.reverse()
+
+            self._levels = levels
+            self._points = points
+            self._tiles.clear()
+            self._generation = generation
+
+    @staticmethod
+    def _finest_key(latitude: float, longitude: float) -> tuple[int, int]:
+        mx, my = _mercator(latitude, longitude)
+        return int(mx * _FINEST_SCALE), int(my * _FINEST_SCALE)
+
+    def upsert(self, park: Park) -> None:
+        """Move, add or drop one park and evict the tiles it touches."""
+        with self._lock:
+            if self._generation is None:
+                return
+            self._discard(park.id)
+            if park.status != INDEXED_STATUS:
+                return
+            latitude, longitude = float(park.latitude), float(park.longitude)
+            key = self._finest_key(latitude, longitude)
+            self._points[park.id] = (latitude, longitude, key)
+            for z in range(_FINEST_LEVEL, -1, -1):
+                shift = _FINEST_LEVEL - z
+                cell_key = (key[0] >> shift, key[1] >> shift)
+                cell = self._levels[z].get(cell_key)
+                if cell is None:
+                    cell = self._levels[z][cell_key] = _Cell()
+                    if z == _FINEST_LEVEL:
+                        cell.ids = set()
+                cell.count += 1
+                cell.sum_latitude += latitude
+                cell.sum_longitude += longitude
+                if cell.ids is not None:
+                    cell.ids.add(park.id)
+            self._evict_tiles(latitude, longitude)
+
+    def remove(self, park_id: UUID) -> None:
+        with self._lock:
+            self._discard(park_id)
+
+    def _discard(self, park_id: UUID) -> None:
+        point = self._points.pop(park_id, None)
+        if point is None:
+            return
+        latitude, longitude, key = point
+        for z in range(_FINEST_LEVEL, -1, -1):
+            shift = _FINEST_LEVEL - z
+            cell_key = (key[0] >> shift, key[1] >> shift)
+            cell = self._levels[z].get(cell_key)
+            if cell is None:
+                continue
+            cell.count -= 1
+            cell.sum_latitude -= latitude
+            cell.sum_longitude -= longitude
+            if cell.ids is not None:
+                cell.ids.discard(park_id)
+            if cell.count <= 0:
+                del self._levels[z][cell_key]
+        self._evict_tiles(latitude, longitude)
+
+    def _evict_tiles(self, latitude: float, longitude: float) -> None:
+        for tile in _tiles_containing(latitude, longitude):
+            self._tiles.pop(tile, None)
+
+    def _single_park_id(self, z: int, cell_key: tuple[int, int]) -> Optional[UUID]:
+        """Walk down the quadtree to the one park inside a count == 1 cell."""
+        cx, cy = cell_key
+        while z < _FINEST_LEVEL:
+            z += 1
+            for child in ((cx * 2, cy * 2), (cx * 2 + 1, cy * 2), (cx * 2, cy * 2 + 1), (cx * 2 + 1, cy * 2 + 1)):
+                if child in self._levels[z]:
+                    cx, cy = child
+                    break
+            else:
+                return None
+        cell = self._levels[z].get((cx, cy))
+        if cell is None or not cell.ids:
+            return None
+        return next(iter(cell.ids))
+
+    def tile(self, z: int, x: int, y: int) -> ParkTileResponse:
+        with self._lock:
+            cached = self._tiles.get((z, x, y))
+            if cached is not None:
+                self._tiles.move_to_end((z, x, y))
+                return cached
+            if z >= INDIVIDUAL_PARKS_ZOOM:
+                response = self._individual_tile(z, x, y)
+            else:
+                response = self._cluster_tile(z, x, y)
+            self._tiles[(z, x, y)] = response
+            if len(self._tiles) > MAX_CACHED_TILES:
+                self._tiles.popitem(last=False)
+            return response
+
+    def _cluster_tile(self, z: int, x: int, y: int) -> ParkTileResponse:
+        level = self._levels[z]
+        clusters: list[ParkClusterResponse] = []
+        parks: list[ParkPinResponse] = []
+        for cx in range(x * CLUSTER_GRID, (x + 1) * CLUSTER_GRID):
+            for cy in range(y * CLUSTER_GRID, (y + 1) * CLUSTER_GRID):
+                cell = level.get((cx, cy))
+                if cell is None:
+                    continue
+                if cell.count == 1:
+                    record = park_index.get(self._single_park_id(z, (cx, cy)))
+                    if record is not None:
+                        parks.append(ParkPinResponse.model_validate(record))
+                        continue
+                clusters.append(
+                    ParkClusterResponse(
+                        id=f"{z}/{cx}/{cy}",
+                        count=cell.count,
+                        latitude=cell.sum_latitude / cell.count,
+                        longitude=cell.sum_longitude / cell.count,
+                    )
+                )
+        return ParkTileResponse(z=z, x=x, y=y, clusters=clusters, parks=parks)
+
+    def _individual_tile(self, z: int, x: int, y: int) -> ParkTileResponse:
+        min_lat, max_lat, min_lng, max_lng = _tile_bounds(z, x, y)
+        n = 2 ** z
+        block = CoordinateBlock.of(park_index.query(min_lat, max_lat, min_lng, max_lng))
+        mx, my = mercator(block.latitudes, block.longitudes)
+        # Tiles are half-open so a park on a shared edge is drawn once.
+        inside = ((mx * n).astype(np.int64) == x) & ((my * n).astype(np.int64) == y)
+        parks = [ParkPinResponse.model_validate(record) for record in block.select(inside)]
+        return ParkTileResponse(z=z, x=x, y=y, parks=parks)
+
+
+park_clusters = ParkClusterIndex()
+
+
+def get_park_tile(db: Session, z: int, x: int, y: int) -> ParkTileResponse:
+    """Clusters (low zoom) or individual parks (high zoom) for one map tile."""
+    if not 0 <= z <= MAX_TILE_ZOOM:
+        raise HTTPException(status_code=400, detail=f"Zoom must be between 0 and {MAX_TILE_ZOOM}")
+    n = 2 ** z
+    if not (0 <= x < n and 0 <= y < n):
+        raise HTTPException(status_code=400, detail="Tile coordinates out of range for zoom level")
+    park_clusters.ensure_built(db)
+    return park_clusters.tile(z, x, y)
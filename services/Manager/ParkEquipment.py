@@ -1,14 +1,48 @@
 """
-Park-equipment list business logic.
+Park-equipment list and write business logic.
+
+Writes change the park's denormalized ``equipment_ids``, which the in-memory
+park views (index, clusters, location tiles) filter on, so every write here
+refreshes them for the affected park.
 """
 from uuid import UUID
 
 from sqlalchemy.orm import Session
 
+from models.database import ParkEquipment
 from models.responses.EquipmentResponses import EquipmentResponse
-from services.Database import get_equipment_by_park
+from services.Database import (
+    add_equipment_to_park,
+    get_equipment_by_park,
+    remove_all_equipment_from_park,
+    remove_equipment_from_park,
+)
+from services.Manager.Parks import notify_parks_changed
 
 
 def get_equipment_for_park(db: Session, park_id: UUID) -> list[EquipmentResponse]:
     """Get all equipment for a park."""
     return get_equipment_by_park(db, park_id)
+
+
+def add_equipment(db: Session, park_id: UUID, equipment_id: UUID) -> ParkEquipment:
+    """Add equipment to a park."""
+    park_equipment = add_equipment_to_park(db, park_id, equipment_id)
+    notify_parks_changed(db, [park_id])
+    return park_equipment
+
+
+def remove_equipment(db: Session, park_id: UUID, equipment_id: UUID) -> bool:
+    """Remove equipment from a park. Returns False if the park did not have it."""
+    removed = remove_equipment_from_park(db, park_id, equipment_id)
+    if removed:
+        notify_parks_changed(db, [park_id])
+    return removed
+
+
+def remove_all_equipment(db: Session, park_id: UUID) -> int:
+    """Remove all equipment from a park. Returns count of deleted items."""
+    count = remove_all_equipment_from_park(db, park_id)
+    if count:
+        notify_parks_changed(db, [park_id])
+    return count
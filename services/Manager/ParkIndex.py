@@ -0,0 +1,366 @@
+"""
+In-memory spatial index of approved parks for map (bounding box) queries.
+
+Approved parks are copied into compact ``ParkRecord`` objects and bucketed
+into a fixed-size lat/lng grid, so a viewport query only touches the cells it
+overlaps instead of scanning the ``parks`` table. Each cell also keeps a
+lazily built ``CoordinateBlock`` so bounds and distance checks run through
+the vectorized ``GeoKernels`` over a whole cell at once. The index is loaded lazily
+on first use, patched in place when a park is moderated, submitted or deleted,
+and rebuilt from the database once it is older than
+``PARK_INDEX_MAX_AGE_SECONDS`` (this bounds staleness when several workers
+each hold their own copy).
+"""
+import math
+import os
+import threading
+import time
+from typing import Optional
+from uuid import UUID
+
+import numpy as np
+
+from sqlalchemy.orm import Session
+
+from models.database import Park
+from services.Database import get_parks_by_status_with_version
+from services.Manager.GeoKernels import CoordinateBlock, haversine_miles, within_bounds
+
+# Grid cell size in degrees. 0.5° is roughly 55 km of latitude, small enough
+# that a city viewport touches a handful of cells.
+CELL_DEGREES = 0.5
+INDEX_MAX_AGE_SECONDS = float(os.getenv("PARK_INDEX_MAX_AGE_SECONDS", "300"))
+INDEXED_STATUS = "approved"
+EARTH_RADIUS_MILES = 3958.8
+_LAT_CELLS = round(180 / CELL_DEGREES)
+_LNG_CELLS = round(360 / CELL_DEGREES)
+
+
+class ParkRecord:
+    """Compact, read-only copy of the park fields served by the map endpoints."""
+
+    __slots__ = (
+        "id",
+        "name",
+        "description",
+        "latitude",
+        "longitude",
+        "address",
+        "status",
+        "submitted_by",
+        "submit_date",
+        "approved_by",
+        "approved_at",
+        "admin_notes",
+        "equipment_ids",
+        "created_at",
+        "updated_at",
+    )
+
+    def __init__(self, park: Park):
+        self.id = park.id
+        self.name = park.name
+        self.description = park.description
+        self.latitude = float(park.latitude)
+        self.longitude = float(park.longitude)
+        self.address = park.address
+        self.status = park.status
+        self.submitted_by = park.submitted_by
+        self.submit_date = park.submit_date
+        self.approved_by = park.approved_by
+        self.approved_at = park.approved_at
+        self.admin_notes = park.admin_notes
+        self.equipment_ids = tuple(park.equipment_ids or ())
+        self.created_at = park.created_at
+        self.updated_at = park.updated_at
+
+    def __repr__(self):
+        return f"<ParkRecord(id={self.id}, name={self.name})>"
+
+
+def _cell_key(latitude: float, longitude: float) -> tuple[int, int]:
+    # Clamp so parks on the north pole / antimeridian share the last cell.
+    return (
+        min(math.floor(latitude / CELL_DEGREES), _LAT_CELLS // 2 - 1),
+        min(math.floor(longitude / CELL_DEGREES), _LNG_CELLS // 2 - 1),
+    )
+
+
+def _wrap_col(col: int) -> int:
+    """Wrap a longitude cell index across the antimeridian."""
+    half = _LNG_CELLS // 2
+    return (col + half) % _LNG_CELLS - half
+
+
+def _covered_radius_miles(latitude: float, longitude: float, row: int, col: int, ring: int) -> float:
+    """
+    Lower bound on the distance from (latitude, longitude) to any point outside
+    the square of cells within ``ring`` of (row, col).
+    """
+    top = (row + ring + 1) * CELL_DEGREES
+    bottom = (row - ring) * CELL_DEGREES
+    east = (col + ring + 1) * CELL_DEGREES - longitude
+    west = longitude - (col - ring) * CELL_DEGREES
+    to_pole = math.radians(90 - abs(latitude))
+
+    bounds = []
+    if top < 90:
+        bounds.append(math.radians(top - latitude))
+    if bottom > -90:
+        bounds.append(math.radians(latitude - bottom))
+    for delta in (east, west):
+        if delta >= 180:
+            continue
+        if delta >= 90:
+            bounds.append(to_pole)
+        else:
+            # Great-circle distance to the meridian ``delta`` degrees away.
+            cross = math.sin(math.radians(delta)) * math.cos(math.radians(latitude))
+            bounds.append(min(math.asin(min(1.0, cross)), to_pole))
+    if not bounds:
+        return math.inf
+    return EARTH_RADIUS_MILES * min(bounds)
+
+
+class ParkSpatialIndex:
+    """Grid index of approved parks keyed by ``(lat_cell, lng_cell)``."""
+
+    def __init__(self, max_age_seconds: float = INDEX_MAX_AGE_SECONDS):
+        self.max_age_seconds = max_age_seconds
+        self._lock = threading.RLock()
+        self._cells: dict[tuple[int, int], dict[UUID, ParkRecord]] = {}
+        self._cell_of: dict[UUID, tuple[int, int]] = {}
+        # Coordinate arrays per cell, built on first read and dropped when the cell changes.
+        self._blocks: dict[tuple[int, int], CoordinateBlock] = {}
+        self._loaded_at: Optional[float] = None
+        # Bumped on every rebuild/invalidate so derived views know to rebuild too.
+        self.generation = 0
+        # parks_version the index reflects: read with the rows on rebuild,
+        # re-read after each patch (see record_version). Keys the ETag.
+        self.version: Optional[int] = None
+
+    def __len__(self) -> int:
+        return len(self._cell_of)
+
+    @property
+    def is_loaded(self) -> bool:
+        return self._loaded_at is not None
+
+    def ensure_loaded(self, db: Session) -> None:
+        """Build the index on first use, or rebuild it once it is too old."""
+        loaded_at = self._loaded_at
+        if loaded_at is not None and time.monotonic() - loaded_at < self.max_age_seconds:
+            return
+        self.rebuild(db)
+
+    def rebuild(self, db: Session) -> None:
+        """Reload every approved park from the database."""
+        parks, version = get_parks_by_status_with_version(db, INDEXED_STATUS)
+        cells: dict[tuple[int, int], dict[UUID, ParkRecord]] = {}
+        cell_of: dict[UUID, tuple[int, int]] = {}
+        for park in parks:
+            record = ParkRecord(park)
+            key = _cell_key(record.latitude, record.longitude)
+            cells.setdefault(key, {})[record.id] = record
+            cell_of[record.id] = key
+        with self._lock:
+            self._cells = cells
+            self._cell_of = cell_of
+            self._blocks = {}
+            self._loaded_at = time.monotonic()
+            self.generation += 1
+            self.version = version
+
+    def invalidate(self) -> None:
+        """Drop the index; the next query reloads it from the database."""
+        with self._lock:
+            self._cells = {}
+            self._cell_of = {}
+            self._blocks = {}
+            self._loaded_at = None
+            self.generation += 1
+            self.version = None
+
+    def get(self, park_id: UUID) -> Optional[ParkRecord]:
+        """Return the indexed record for a park, if it is approved and indexed."""
+        with self._lock:
+            key = self._cell_of.get(park_id)
+            if key is None:
+                return None
+            return self._cells[key].get(park_id)
+
+    def records(self) -> list[ParkRecord]:
+        """Snapshot of every indexed record."""
+        with self._lock:
+            return [record for cell in self._cells.values() for record in cell.values()]
+
+    def upsert(self, park: Park) -> None:
+        """Insert, move, or drop a park depending on its current status and position."""
+        with self._lock:
+            if not self.is_loaded:
+                return
+            self._discard(park.id)
+            if park.status != INDEXED_STATUS:
+                return
+            record = ParkRecord(park)
+            key = _cell_key(record.latitude, record.longitude)
+            self._cells.setdefault(key, {})[record.id] = record
+            self._cell_of[record.id] = key
+            self._blocks.pop(key, None)
+
+    def remove(self, park_id: UUID) -> None:
+        """Drop a park from the index (no-op if it is not indexed)."""
+        with self._lock:
+            self._discard(park_id)
+
+    def record_version(self, version: int) -> None:
+        """
+        Note the parks_version read after a committed write was patched in.
+        A write from another process committed in between is attributed to
+        this version too; the next rebuild corrects it.
+        """
+        with self._lock:
+            if self.is_loaded and (self.version is None or version > self.version):
+                self.version = version
+
+    def _discard(self, park_id: UUID) -> None:
+        key = self._cell_of.pop(park_id, None)
+        if key is None:
+            return
+        self._blocks.pop(key, None)
+        cell = self._cells.get(key)
+        if cell is not None:
+            cell.pop(park_id, None)
+            if not cell:
+                del self._cells[key]
+
+    def _block(self, key: tuple[int, int]) -> Optional[CoordinateBlock]:
+        """Coordinate block of a cell (caller holds the lock)."""
+        block = self._blocks.get(key)
+        if block is None:
+            cell = self._cells.get(key)
+            if not cell:
+                return None
+            block = self._blocks[key] = CoordinateBlock.of(cell.values())
+        return block
+
+    def query(
+        self,
+        min_latitude: float,
+        max_latitude: float,
+        min_longitude: float,
+        max_longitude: float,
+    ) -> list[ParkRecord]:
+        """Return approved parks inside the (inclusive) bounding box."""
+        if min_latitude > max_latitude or min_longitude > max_longitude:
+            return []
+        row_lo, col_lo = _cell_key(min_latitude, min_longitude)
+        row_hi, col_hi = _cell_key(max_latitude, max_longitude)
+
+        results: list[ParkRecord] = []
+        with self._lock:
+            span = (row_hi - row_lo + 1) * (col_hi - col_lo + 1)
+            if span <= len(self._cells):
+                keys = (
+                    (row, col)
+                    for row in range(row_lo, row_hi + 1)
+                    for col in range(col_lo, col_hi + 1)
+                )
+            else:
+                # Huge viewport: walking the occupied cells is cheaper than the grid.
+                keys = [
+                    key for key in self._cells
+                    if row_lo <= key[0] <= row_hi and col_lo <= key[1] <= col_hi
+                ]
+            for key in keys:
+                block = self._block(key)
+                if block is None:
+                    continue
+                results.extend(
+                    block.select(
+                        within_bounds(
+                            block.latitudes,
+                            block.longitudes,
+                            min_latitude,
+                            max_latitude,
+                            min_longitude,
+                            max_longitude,
+                        )
+                    )
+                )
+        return results
+
+    def nearest(
+        self,
+        latitude: float,
+        longitude: float,
+        k: int,
+        after: Optional[tuple[float, UUID]] = None,
+    ) -> list[tuple[ParkRecord, float]]:
+        """
+        Return up to ``k`` approved parks ordered by great-circle distance (miles).
+
+        Rings of grid cells are searched outward from the centre until ``k``
+        parks are known to be closer than anything outside the searched area.
+        ``after`` is the ``(distance, id)`` of the last park on the previous
+        page; only parks that sort after it are returned.
+        """
+        if k <= 0:
+            return []
+        row, col = _cell_key(latitude, longitude)
+        # Distances and records of every candidate, one entry per visited cell.
+        distance_blocks: list[np.ndarray] = []
+        record_blocks: list[list[ParkRecord]] = []
+        visited: set[tuple[int, int]] = set()
+
+        with self._lock:
+            total = len(self._cell_of)
+            seen = 0
+            for ring in range(max(_LAT_CELLS, _LNG_CELLS)):
+                for ring_row in range(row - ring, row + ring + 1):
+                    if not -(_LAT_CELLS // 2) <= ring_row < _LAT_CELLS // 2:
+                        continue
+                    edge = ring_row in (row - ring, row + ring)
+                    cols = range(col - ring, col + ring + 1) if edge else (col - ring, col + ring)
+                    for ring_col in cols:
+                        key = (ring_row, _wrap_col(ring_col))
+                        if key in visited:
+                            continue
+                        visited.add(key)
+                        block = self._block(key)
+                        if block is None:
+                            continue
+                        seen += len(block)
+                        distances = haversine_miles(
+                            latitude, longitude, block.latitudes, block.longitudes
+                        )
+                        if after is None:
+                            distance_blocks.append(distances)
+                            record_blocks.append(block.items)
+                            continue
+                        keep = distances > after[0]
+                        for i in np.flatnonzero(distances == after[0]):
+                            keep[i] = str(block.items[i].id) > str(after[1])
+                        distance_blocks.append(distances[keep])
+                        record_blocks.append(block.select(keep))
+
+                covered = _covered_radius_miles(latitude, longitude, row, col, ring)
+                if seen >= total or covered == math.inf:
+                    break
+                if sum(int(np.count_nonzero(d <= covered)) for d in distance_blocks) >= k:
+                    break
+
+        if not distance_blocks:
+            return []
+        distances = np.concatenate(distance_blocks)
+        records = [record for block in record_blocks for record in block]
+        candidates = np.arange(len(distances))
+        if len(candidates) > k:
+            # Keep the k nearest plus anything tied with the k-th before the exact sort.
+            kth = np.partition(distances, k - 1)[k - 1]
+            candidates = np.flatnonzero(distances <= kth)
+        candidates = sorted(candidates, key=lambda i: (distances[i], str(records[i].id)))
+        return [(records[i], float(distances[i])) for i in candidates[:k]]
+
+
+park_index = ParkSpatialIndex()
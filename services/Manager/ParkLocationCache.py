@@ -0,0 +1,247 @@
+"""
+Tile cache for database-backed bounding box queries.
+
+Map clients ask for ``/api/park/location`` with slightly different float
+bounds every time, so caching whole responses never hits. Instead the box is
+snapped to a fixed grid of ``TILE_DEGREES`` tiles and the park ids of each
+tile are cached separately (LRU, ``MAX_CACHED_TILES`` tiles,
+``CACHE_TTL_SECONDS`` time-to-live), together with the few columns needed to
+trim and filter them (``TILE_FIELDS``). A request is answered by composing its
+tiles and trimming to the exact bounds (vectorized over each tile's
+``CoordinateBlock``); only the missing tiles are loaded, with one
+column-restricted query. The response fields themselves are selected by id
+afterwards (see ``Parks.get_parks_in_location``).
+
+Approved parks are served by the in-memory ``park_index`` instead; this cache
+covers the other statuses, which are read much less often but still from
+clustered viewports (the moderation map).
+"""
+import math
+import os
+import threading
+import time
+from collections import OrderedDict
+from decimal import Decimal
+from typing import Optional
+from uuid import UUID
+
+from sqlalchemy.orm import Session
+
+from services.Database import get_parks_by_location
+from services.Manager.GeoKernels import CoordinateBlock, within_bounds
+
+TILE_DEGREES = 0.25
+CACHE_TTL_SECONDS = float(os.getenv("PARK_LOCATION_CACHE_TTL_SECONDS", "60"))
+MAX_CACHED_TILES = int(os.getenv("PARK_LOCATION_CACHE_MAX_TILES", "2048"))
+# Boxes covering more tiles than this go straight to the database.
+MAX_TILES_PER_QUERY = 256
+
+TileKey = tuple[Optional[str], int, int]
+# Columns cached per park: enough to trim to the bounds and filter by equipment.
+TILE_FIELDS = ("id", "latitude", "longitude", "equipment_ids")
+
+
+def _tile_range(minimum: float, maximum: float) -> range:
+    return range(math.floor(minimum / TILE_DEGREES), math.floor(maximum / TILE_DEGREES) + 1)
+
+
+class TileEntry:
+    """The ``TILE_FIELDS`` of one cached park."""
+
+    __slots__ = TILE_FIELDS
+
+    def __init__(self, row):
+        self.id = row.id
+        self.latitude = float(row.latitude)
+        self.longitude = float(row.longitude)
+        self.equipment_ids = tuple(row.equipment_ids or ())
+
+
+class _Tile:
+    __slots__ = ("park_ids", "block", "expires_at")
+
+    def __init__(self, park_ids: frozenset[UUID], block: CoordinateBlock, expires_at: float):
+        self.park_ids = park_ids
+        self.block = block
+        self.expires_at = expires_at
+
+
+class ParkLocationCache:
+    """LRU + TTL cache of park ids per ``(status, lat_tile, lng_tile)``."""
+
+    def __init__(self, max_tiles: int = MAX_CACHED_TILES, ttl_seconds: float = CACHE_TTL_SECONDS):
+        self.max_tiles = max_tiles
+        self.ttl_seconds = ttl_seconds
+        self._lock = threading.RLock()
+        self._tiles: OrderedDict[TileKey, _Tile] = OrderedDict()
+        # Bumped by every invalidation so a load that raced with one is not stored.
+        self._generation = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.bypasses = 0
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "tiles": len(self._tiles),
+                "max_tiles": self.max_tiles,
+                "ttl_seconds": self.ttl_seconds,
+                "tile_degrees": TILE_DEGREES,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+                "bypasses": self.bypasses,
+            }
+
+    def query(
+        self,
+        db: Session,
+        min_latitude: float,
+        max_latitude: float,
+        min_longitude: float,
+        max_longitude: float,
+        status: Optional[str],
+    ) -> list[TileEntry]:
+        """Parks with ``status`` inside the (inclusive) bounding box."""
+        if min_latitude > max_latitude or min_longitude > max_longitude:
+            return []
+        rows = _tile_range(min_latitude, max_latitude)
+        cols = _tile_range(min_longitude, max_longitude)
+        if len(rows) * len(cols) > MAX_TILES_PER_QUERY:
+            with self._lock:
+                self.bypasses += 1
+            return self._load(db, min_latitude, max_latitude, min_longitude, max_longitude, status)
+
+        keys = [(status, row, col) for row in rows for col in cols]
+        tiles: dict[TileKey, CoordinateBlock] = {}
+        now = time.monotonic()
+        with self._lock:
+            for key in keys:
+                tile = self._tiles.get(key)
+                if tile is not None and tile.expires_at <= now:
+                    del self._tiles[key]
+                    self.expirations += 1
+                    tile = None
+                if tile is None:
+                    self.misses += 1
+                    continue
+                self.hits += 1
+                self._tiles.move_to_end(key)
+                tiles[key] = tile.block
+            generation = self._generation
+
+        missing = [key for key in keys if key not in tiles]
+        if missing:
+            tiles.update(self._fill(db, missing, status, generation))
+
+        results: list[TileEntry] = []
+        for key in keys:
+            block = tiles[key]
+            results.extend(
+                block.select(
+                    within_bounds(
+                        block.latitudes,
+                        block.longitudes,
+                        min_latitude,
+                        max_latitude,
+                        min_longitude,
+                        max_longitude,
+                    )
+                )
+            )
+        return results
+
+    def _fill(
+        self,
+        db: Session,
+        missing: list[TileKey],
+        status: Optional[str],
+        generation: int,
+    ) -> dict[TileKey, CoordinateBlock]:
+        """Load every missing tile with a single query over their bounding tiles."""
+        row_lo = min(key[1] for key in missing)
+        row_hi = max(key[1] for key in missing)
+        col_lo = min(key[2] for key in missing)
+        col_hi = max(key[2] for key in missing)
+        loaded: dict[TileKey, list[TileEntry]] = {key: [] for key in missing}
+        for entry in self._load(
+            db,
+            row_lo * TILE_DEGREES,
+            (row_hi + 1) * TILE_DEGREES,
+            col_lo * TILE_DEGREES,
+            (col_hi + 1) * TILE_DEGREES,
+            status,
+        ):
+            key = (
+                status,
+                math.floor(entry.latitude / TILE_DEGREES),
+                math.floor(entry.longitude / TILE_DEGREES),
+            )
+            tile = loaded.get(key)
+            if tile is not None:
+                tile.append(entry)
+
+        blocks = {key: CoordinateBlock.of(entries) for key, entries in loaded.items()}
+
+        with self._lock:
+            if generation == self._generation:
+                expires_at = time.monotonic() + self.ttl_seconds
+                for key, entries in loaded.items():
+                    park_ids = frozenset(entry.id for entry in entries)
+                    self._tiles[key] = _Tile(park_ids, blocks[key], expires_at)
+                    self._tiles.move_to_end(key)
+                while len(self._tiles) > self.max_tiles:
+                    self._tiles.popitem(last=False)
+                    self.evictions += 1
+        return blocks
+
+    @staticmethod
+    def _load(
+        db: Session,
+        min_latitude: float,
+        max_latitude: float,
+        min_longitude: float,
+        max_longitude: float,
+        status: Optional[str],
+    ) -> list[TileEntry]:
+        rows = get_parks_by_location(
+            db=db,
+            min_latitude=Decimal(str(min_latitude)),
+            max_latitude=Decimal(str(max_latitude)),
+            min_longitude=Decimal(str(min_longitude)),
+            max_longitude=Decimal(str(max_longitude)),
+            status=status,
+            fields=TILE_FIELDS,
+        )
+        return [TileEntry(row) for row in rows]
+
+    def invalidate_park(
+        self,
+        park_id: UUID,
+        latitude: Optional[float] = None,
+        longitude: Optional[float] = None,
+    ) -> None:
+        """Evict every tile holding the park, plus the tiles (any status) at its position."""
+        position = None
+        if latitude is not None and longitude is not None:
+            position = (math.floor(latitude / TILE_DEGREES), math.floor(longitude / TILE_DEGREES))
+        with self._lock:
+            self._generation += 1
+            stale = [
+                key
+                for key, tile in self._tiles.items()
+                if park_id in tile.park_ids or key[1:] == position
+            ]
+            for key in stale:
+                del self._tiles[key]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._generation += 1
+            self._tiles.clear()
+
+
+park_location_cache = ParkLocationCache()
@@ -0,0 +1,225 @@
+"""
+Precompressed snapshot of every approved park for the first map load.
+
+The snapshot is the same for every user, so it is written once as a compact
+JSON file plus gzip and brotli variants, named by a content hash. Requests are answered straight from
+disk with ``FileResponse``, so the hot path does no query and no serialization.
+
+The snapshot is rebuilt from the in-memory ``park_index`` (not Postgres),
+debounced by ``SNAPSHOT_DEBOUNCE_SECONDS`` after the approved set changes, and
+synchronously when the index itself was reloaded.
+
+The directory may be shared by several workers, each serving the version of
+its own index. A worker refreshes the files' mtime whenever it rebuilds to
+the same version, so files of a version someone still serves are never older
+than ``PARK_INDEX_MAX_AGE_SECONDS``; files untouched for
+``SNAPSHOT_RETENTION_SECONDS`` (longer than that) are pruned.
+"""
+import gzip
+import hashlib
+import json
+import logging
+import os
+import re
+import tempfile
+import threading
+import time
+from typing import Optional
+
+from fastapi import HTTPException
+from sqlalchemy.orm import Session
+
+from services.Manager.Exports import accepts_encoding
+from services.Manager.ParkIndex import INDEX_MAX_AGE_SECONDS, park_index
+
+try:
+    import brotli
+except ImportError:  # without it only the gzip and identity variants are written
+    brotli = None
+
+logger = logging.getLogger(__name__)
+
+SNAPSHOT_DIR = os.getenv(
+    "PARK_SNAPSHOT_DIR", os.path.join(tempfile.gettempdir(), "barzmap-park-snapshots")
+)
+SNAPSHOT_DEBOUNCE_SECONDS = float(os.getenv("PARK_SNAPSHOT_DEBOUNCE_SECONDS", "5"))
+SNAPSHOT_FIELDS = ("id", "name", "latitude", "longitude")
+# Older versions are kept a while so clients holding their URL (and other
+# workers whose index has not reloaded yet) can still serve them.
+SNAPSHOT_RETENTION_SECONDS = max(
+    float(os.getenv("PARK_SNAPSHOT_RETENTION_SECONDS", str(2 * INDEX_MAX_AGE_SECONDS))),
+    INDEX_MAX_AGE_SECONDS + 60,
+)
+# Versions this close to pruning are no longer handed out by ``get``, so a
+# response is not left holding a file that is about to be deleted.
+_SERVE_MARGIN_SECONDS = 60.0
+_ETAG_SUFFIXES = {"br": "br", "gzip": "gz"}
+_VERSION_PATTERN = re.compile(r"[0-9a-f]{24}")
+_FILE_PATTERN = re.compile(r"parks-[0-9a-f]{24}\.json(\.gz|\.br)?")
+
+
+class Snapshot:
+    """One written snapshot version and its files, keyed by content coding."""
+
+    __slots__ = ("version", "generation", "files")
+
+    def __init__(self, version: str, generation: int, files: dict[str, str]):
+        self.version = version
+        self.generation = generation
+        self.files = files
+
+    def etag_for(self, coding: Optional[str]) -> str:
+        """Strong ETag of one file; each content-coding is a different representation."""
+        if coding is None:
+            return f'"{self.version}"'
+        return f'"{self.version}-{_ETAG_SUFFIXES[coding]}"'
+
+    def path_for(self, accept_encoding: Optional[str]) -> tuple[str, Optional[str]]:
+        """Best precompressed file for an Accept-Encoding header, and its coding."""
+        for coding in ("br", "gzip"):
+            if coding in self.files and accepts_encoding(accept_encoding, coding):
+                return self.files[coding], coding
+        return self.files["identity"], None
+
+
+def _write_atomic(path: str, data: bytes) -> None:
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+def _touch(paths) -> bool:
+    """Refresh the mtime of every path; False if any of them is gone."""
+    try:
+        for path in paths:
+            os.utime(path)
+    except FileNotFoundError:
+        return False
+    return True
+
+
+class ParkSnapshots:
+    """Builds, versions and debounces the approved-parks snapshot files."""
+
+    def __init__(self, directory: str = SNAPSHOT_DIR, debounce_seconds: float = SNAPSHOT_DEBOUNCE_SECONDS):
+        self.directory = directory
+        self.debounce_seconds = debounce_seconds
+        self._lock = threading.Lock()
+        self._timer: Optional[threading.Timer] = None
+        self._current: Optional[Snapshot] = None
+
+    def current(self, db: Session) -> Snapshot:
+        """The latest snapshot, rebuilt first if missing or the index was reloaded."""
+        park_index.ensure_loaded(db)
+        snapshot = self._current
+        if snapshot is None or snapshot.generation != park_index.generation:
+            snapshot = self.rebuild()
+        return snapshot
+
+    def get(self, version: str) -> Optional[Snapshot]:
+        """A recent snapshot by version (written by any worker), if its files are still kept."""
+        snapshot = self._current
+        if snapshot is not None and snapshot.version == version:
+            return snapshot
+        if not _VERSION_PATTERN.fullmatch(version):
+            return None
+        files = self._files_for(version)
+        try:
+            age = time.time() - os.stat(files["identity"]).st_mtime
+        except FileNotFoundError:
+            return None
+        if age > SNAPSHOT_RETENTION_SECONDS - _SERVE_MARGIN_SECONDS:
+            return None
+        files = {coding: path for coding, path in files.items() if os.path.exists(path)}
+        return Snapshot(version, -1, files)
+
+    def schedule_rebuild(self) -> None:
+        """Rebuild once no further change arrived for ``debounce_seconds``."""
+        if not park_index.is_loaded:
+            return
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+            self._timer = threading.Timer(self.debounce_seconds, self._rebuild_quietly)
+            self._timer.daemon = True
+            self._timer.start()
+
+    def _rebuild_quietly(self) -> None:
+        try:
+            self.rebuild()
+        except Exception:
+            logger.exception("Failed to rebuild park snapshot")
+
+    def _files_for(self, version: str) -> dict[str, str]:
+        base = os.path.join(self.directory, f"parks-{version}.json")
+        files = {"identity": base, "gzip": f"{base}.gz"}
+        if brotli is not None:
+            files["br"] = f"{base}.br"
+        return files
+
+    def rebuild(self) -> Snapshot:
+        """Write a new snapshot version from the park index."""
+        generation = park_index.generation
+        records = sorted(park_index.records(), key=lambda record: str(record.id))
+        body = json.dumps(
+            {
+                "fields": SNAPSHOT_FIELDS,
+                "parks": [
+                    [str(record.id), record.name, record.latitude, record.longitude]
+                    for record in records
+                ],
+            },
+            separators=(",", ":"),
+            ensure_ascii=False,
+        ).encode("utf-8")
+        version = hashlib.blake2b(body, digest_size=12).hexdigest()
+
+        with self._lock:
+            current = self._current
+            if current is not None and current.version == version and _touch(current.files.values()):
+                current.generation = generation
+                return current
+            os.makedirs(self.directory, exist_ok=True)
+            files = self._files_for(version)
+            _write_atomic(files["gzip"], gzip.compress(body, compresslevel=9, mtime=0))
+            if "br" in files:
+                _write_atomic(files["br"], brotli.compress(body, quality=11))
+            _write_atomic(files["identity"], body)
+
+            snapshot = Snapshot(version, generation, files)
+            self._current = snapshot
+            self._prune(keep=set(files.values()))
+            return snapshot
+
+    def _prune(self, keep: set[str]) -> None:
+        """Delete snapshot files nobody has written or touched for the retention period."""
+        cutoff = time.time() - SNAPSHOT_RETENTION_SECONDS
+        for entry in os.scandir(self.directory):
+            if entry.path in keep or not _FILE_PATTERN.fullmatch(entry.name):
+                continue
+            try:
+                if entry.stat().st_mtime < cutoff:
+                    os.unlink(entry.path)
+            except FileNotFoundError:
+                pass
+
+
+park_snapshots = ParkSnapshots()
+
+
+def get_current_snapshot(db: Session) -> Snapshot:
+    """The latest approved-parks snapshot."""
+    return park_snapshots.current(db)
+
+
+def get_snapshot_version(version: str) -> Snapshot:
+    """A recent snapshot by version. Raises HTTPException if it is not kept."""
+    snapshot = park_snapshots.get(version)
+    if snapshot is None:
+        raise HTTPException(status_code=404, detail="Snapshot version not found")
+    return snapshot
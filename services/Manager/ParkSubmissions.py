@@ -1,21 +1,44 @@
 from fastapi import HTTPException
+from fastapi.concurrency import run_in_threadpool
 from fastapi.datastructures import UploadFile
 from models.requests.ParkSubmissionRequest import ParkSubmissionRequest, ImageSubmission
-from models.responses.ParkSubmissionResponse import ParkSubmissionResponse, ValidationResult
+from models.responses.ParkSubmissionResponse import (
+    ParkSubmissionAcceptedResponse,
+    ParkSubmissionResponse,
+    ValidationResult,
+)
 from sqlalchemy.orm import Session
-from services.Database import get_equipment
-from services.Adapters.CloudflareAdapter import upload_images
-from services.Database.ParksTable import create_park
-from services.Database.ParkEquipmentTable import add_equipment_to_park
-from services.Database.ImagesTable import create_image
+from services.Database import get_existing_equipment_ids
+from services.Adapters.CloudflareAdapter import is_configured, upload_images
+from services.Database.ParksTable import create_park_submission
+from services.Manager.ImageUploadQueue import (
+    discard_staged_images,
+    image_upload_worker,
+    stage_submission_images,
+)
+from services.Manager.Parks import notify_park_changed
 from decimal import Decimal
 from typing import Optional, List
 from uuid import UUID
 import json
 import logging
+import os
 
 logger = logging.getLogger(__name__)
 
+# Cloudflare Images rejects files over 10 MB.
+MAX_IMAGE_BYTES = int(os.getenv("MAX_IMAGE_UPLOAD_BYTES", str(10 * 1024 * 1024)))
+
+
+def _upload_size(image_file: UploadFile) -> int:
+    """Size of a parsed upload, without reading it."""
+    if image_file.size is not None:
+        return image_file.size
+    position = image_file.file.tell()
+    size = image_file.file.seek(0, os.SEEK_END)
+    image_file.file.seek(position)
+    return size
+
 
 async def parse_submission_form_data(
     name: str,
@@ -35,8 +58,12 @@ async def parse_submission_form_data(
     - Image count validation
     - JSON parsing for equipment_ids and image_alt_texts
     - UUID parsing for submitted_by
-    - Reading file contents from UploadFile objects
+    - Per-image size limit (MAX_IMAGE_BYTES)
     - Creating ImageSubmission objects
+    
+    Images are not read here: each ImageSubmission keeps the upload's spooled
+    file (at most 1 MB in memory, the rest on disk) and the storage adapter
+    streams it from there.
     """
     # Handle None or empty images
     images_list = images if images else []
@@ -76,14 +103,20 @@ async def parse_submission_form_data(
         except (json.JSONDecodeError, ValueError) as e:
             raise HTTPException(status_code=400, detail=f"Invalid image_alt_texts format: {str(e)}")
     
-    # Process images - read file data and create ImageSubmission objects
+    # Process images - check sizes and create ImageSubmission objects over the upload files
     image_submissions = []
     if images_list:
         for idx, image_file in enumerate(images_list):
-            file_content = await image_file.read()
+            size = _upload_size(image_file)
+            if size > MAX_IMAGE_BYTES:
+                raise HTTPException(
+                    status_code=413,
+                    detail=f"Image {idx + 1} is larger than {MAX_IMAGE_BYTES // (1024 * 1024)} MB",
+                )
             alt_text = alt_texts_list[idx] if idx < len(alt_texts_list) else None
             image_submissions.append(ImageSubmission(
-                file_data=file_content,
+                file=image_file.file,
+                size=size,
                 alt_text=alt_text
             ))
     
@@ -108,18 +141,16 @@ def validate_submission(
     """
     errors = []
 
-    # Validate equipment IDs exist in database using try/except error handling
+    # Validate equipment IDs exist in database, all with one query
     if submission.equipment_ids:
-        for equipment_id in submission.equipment_ids:
-            try:
-                equipment = get_equipment(db, equipment_id)
-
-                if not equipment:
-                    raise ValueError(f"Equipment with ID {equipment_id} does not exist")
-            except ValueError as e:
-                errors.append(str(e))
-            except Exception as e:
-                errors.append(f"Error validating equipment ID {equipment_id}: {str(e)}")
+        try:
+            existing = get_existing_equipment_ids(db, submission.equipment_ids)
+        except Exception as e:
+            errors.append(f"Error validating equipment IDs: {str(e)}")
+        else:
+            for equipment_id in dict.fromkeys(submission.equipment_ids):
+                if equipment_id not in existing:
+                    errors.append(f"Equipment with ID {equipment_id} does not exist")
 
     # Add more business logic validations here as needed:
     # - Check for duplicate parks at same location
@@ -163,8 +194,20 @@ async def process_submission(submission: ParkSubmissionRequest, db: Session) ->
                 # Continue with park creation even if image upload fails
                 uploaded_images = None
 
-        # Create park record in database
-        park = create_park(
+        # Image rows for the uploads that returned a URL
+        image_rows = []
+        for image in uploaded_images or []:
+            if not image.variants:
+                logger.warning(f"Uploaded image {image.id} has no variants, skipping")
+                continue
+            image_rows.append({
+                "image_url": image.variants[0],
+                "thumbnail_url": image.variants[-1] if len(image.variants) > 1 else None,
+                "uploaded_by": submission.submitted_by,
+            })
+
+        # Park, equipment links and images in one transaction
+        park = create_park_submission(
             db=db,
             name=submission.name,
             latitude=Decimal(str(submission.latitude)),
@@ -172,45 +215,12 @@ async def process_submission(submission: ParkSubmissionRequest, db: Session) ->
             description=submission.description,
             address=submission.address,
             submitted_by=submission.submitted_by,
-            status="pending",
+            equipment_ids=submission.equipment_ids or [],
+            images=image_rows,
         )
-        
-        # Link equipment to park
-        if submission.equipment_ids:
-            for equipment_id in submission.equipment_ids:
-                add_equipment_to_park(
-                    db=db,
-                    park_id=park.id,
-                    equipment_id=equipment_id,
-                )
-        
-        # Link images to park
-        images_uploaded_count = 0
-        if uploaded_images:
-            for index, image in enumerate(uploaded_images):
-                image_url = image.variants[0] if image.variants else None
-                if not image_url:
-                    continue
-                
-                try:
-                    created_image = create_image(
-                        db=db,
-                        park_id=park.id,
-                        image_url=image_url,
-                        uploaded_by=submission.submitted_by,
-                        thumbnail_url=image.variants[-1] if image.variants and len(image.variants) > 1 else None,
-                        is_primary=(index == 0),
-                        is_approved=False,
-                    )
-                    # Verify creation was successful
-                    if created_image and created_image.id:
-                        images_uploaded_count += 1
-                    else:
-                        logger.warning(f"Image creation returned None or invalid image for index {index}")
-                except Exception as e:
-                    logger.error(f"Failed to create image at index {index}: {str(e)}", exc_info=True)
-                    # Continue processing other images even if one fails
-        
+        notify_park_changed(park, db)
+        images_uploaded_count = len(image_rows)
+
 
         return ParkSubmissionResponse(
             park_id=park.id,
@@ -233,3 +243,57 @@ async def process_submission(submission: ParkSubmissionRequest, db: Session) ->
                 "error": str(e),
             },
         )
+
+
+async def accept_submission(submission: ParkSubmissionRequest, db: Session) -> ParkSubmissionAcceptedResponse:
+    """
+    Create the park now and queue its images for background upload (see
+    ImageUploadQueue). Raises HTTPException on validation errors.
+    """
+    # Staging copies up to five image files; keep it and the queries off the event loop.
+    park, images_queued = await run_in_threadpool(_create_accepted_submission, submission, db)
+    image_upload_worker.wake()
+
+    return ParkSubmissionAcceptedResponse(
+        submission_id=park.id,
+        status=park.status,
+        image_status=park.image_status,
+        images_queued=images_queued,
+    )
+
+
+def _create_accepted_submission(submission: ParkSubmissionRequest, db: Session):
+    """Validate, stage the images and create the park with its upload jobs (blocking)."""
+    validation_result = validate_submission(submission, db)
+    if not validation_result.is_valid:
+        raise HTTPException(
+            status_code=400,
+            detail={
+                "message": "Park submission validation failed",
+                "errors": validation_result.errors,
+            },
+        )
+    if submission.images and not is_configured():
+        raise HTTPException(
+            status_code=503,
+            detail="Image upload service unavailable - missing configuration",
+        )
+
+    image_jobs = stage_submission_images(submission.images or [], submission.submitted_by)
+    try:
+        park = create_park_submission(
+            db=db,
+            name=submission.name,
+            latitude=Decimal(str(submission.latitude)),
+            longitude=Decimal(str(submission.longitude)),
+            description=submission.description,
+            address=submission.address,
+            submitted_by=submission.submitted_by,
+            equipment_ids=submission.equipment_ids or [],
+            image_jobs=image_jobs,
+        )
+    except BaseException:
+        discard_staged_images(job["file_path"] for job in image_jobs)
+        raise
+    notify_park_changed(park, db)
+    return park, len(image_jobs)
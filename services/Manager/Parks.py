@@ -1,6 +1,10 @@
 """
 Park list, location, moderation, and delete business logic.
 """
+import base64
+import binascii
+import json
+import math
 from decimal import Decimal
 from uuid import UUID
 
@@ -9,29 +13,117 @@ from sqlalchemy.orm import Session
 
 from models.database import Park
 from models.requests.admin import ModerateParkSubmissionRequest
-from models.requests.parks import ModerateParkRequest
-from models.responses.AdminResponses import ParkSubmissionDetail
-from models.responses.ParksResponses import ParkResponse
+from models.requests.parks import ModerateParkRequest, ParkLocationBatchRequest
+from models.responses.AdminResponses import (
+    AdminStatsResponse,
+    PaginationInfo,
+    ParkSubmissionDetail,
+    ParkSubmissionItem,
+    ParkSubmissionsListResponse,
+)
+from models.responses.ParksResponses import (
+    NearbyParkResponse,
+    NearestParksResponse,
+    ParkLocationBatchResponse,
+    ParkLocationCacheStatsResponse,
+    ParkLocationDeltaResponse,
+    ParkResponse,
+)
 from services.Database import (
     get_park,
-    get_all_parks,
-    get_parks_by_location,
+    get_parks_page,
+    get_parks_by_ids,
+    get_parks_version,
+    get_parks_by_locations,
+    get_parks_by_location_delta,
     moderate_park,
     delete_park,
-    get_equipment_by_park,
-    get_images_by_park,
+    get_park_submissions_paginated,
+    get_park_status_counts,
+    get_equipment_names_by_parks,
+    get_image_urls_by_parks,
+    get_user_names,
 )
 from services.Adapters.CloudflareAdapter import delete_image as cloudflare_delete_image
+from services.Manager.ImageUploadQueue import discard_queued_images
 from services.Manager.Images import get_images_for_park
+from services.Manager.ParkClusters import park_clusters
+from services.Manager.ParkIndex import INDEXED_STATUS, park_index
+from services.Manager.ParkLocationCache import TILE_FIELDS, TileEntry, park_location_cache
+from services.Manager.ParkSnapshots import park_snapshots
+
+# Fields of a full park in list responses.
+PARK_RESPONSE_FIELDS = list(ParkResponse.model_fields)
+
+def parse_park_fields(fields: str | None) -> list[str] | None:
+    """
+    Parse a comma-separated sparse fieldset (e.g. ``"id,name,latitude,longitude"``).
+    ``id`` is always included. Raises HTTPException on unknown fields.
+    """
+    if not fields:
+        return None
+    requested = [field.strip() for field in fields.split(",") if field.strip()]
+    unknown = [field for field in requested if field not in ParkResponse.model_fields]
+    if unknown:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Unknown park fields: {', '.join(unknown)}",
+        )
+    return list(dict.fromkeys(["id", *requested]))
+
+def parse_equipment_filter(equipment: str | None) -> list[UUID] | None:
+    """Parse a comma-separated list of equipment ids. Raises HTTPException on a malformed id."""
+    if not equipment:
+        return None
+    try:
+        ids = [UUID(value.strip()) for value in equipment.split(",") if value.strip()]
+    except ValueError:
+        raise HTTPException(status_code=400, detail="equipment must be comma-separated equipment ids")
+    return list(dict.fromkeys(ids)) or None
+
+def _filter_equipment(parks: list, equipment_ids: list[UUID], match: str) -> list:
+    """In-memory counterpart of the ``equipment_ids`` @> / && predicate."""
+    wanted = set(equipment_ids)
+    if match == "any":
+        return [park for park in parks if not wanted.isdisjoint(park.equipment_ids)]
+    return [park for park in parks if wanted.issubset(park.equipment_ids)]
+
+def _project(parks: list, fields: list[str]) -> list[dict]:
+    """Reduce rows or records to plain dicts holding only ``fields``."""
+    return [{field: getattr(park, field) for field in fields} for park in parks]
 
 def get_parks_list(
     db: Session,
     skip: int = 0,
     limit: int = 100,
     status: str | None = None,
-) -> list[ParkResponse]:
-    """Get all parks with optional filtering."""
-    return get_all_parks(db, skip=skip, limit=limit, status=status)
+    cursor: str | None = None,
+    fields: list[str] | None = None,
+    equipment_ids: list[UUID] | None = None,
+    equipment_match: str = "all",
+) -> tuple[list[dict], str | None]:
+    """
+    Get one page of parks with optional filtering, plus the cursor for the
+    next page. ``cursor`` takes precedence over ``skip``. The page is a list
+    of plain dicts (all ParkResponse fields, or only ``fields``) read from
+    Core rows. ``equipment_ids`` keeps parks having all
+    (``equipment_match="all"``) or any of that equipment.
+    """
+    fields = fields or PARK_RESPONSE_FIELDS
+    try:
+        parks, next_cursor = get_parks_page(
+            db,
+            skip=skip,
+            limit=limit,
+            status=status,
+            cursor=cursor,
+            fields=fields,
+            equipment_ids=equipment_ids,
+            equipment_match=equipment_match,
+        )
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    return _project(parks, fields), next_cursor
 
 def get_parks_in_location(
     db: Session,
@@ -40,42 +132,316 @@ def get_parks_in_location(
     min_longitude: float,
     max_longitude: float,
     status: str | None = "approved",
-) -> list[ParkResponse]:
-    """Get parks within a geographic bounding box."""
-    return get_parks_by_location(
-        db=db,
-        min_latitude=Decimal(str(min_latitude)),
-        max_latitude=Decimal(str(max_latitude)),
-        min_longitude=Decimal(str(min_longitude)),
-        max_longitude=Decimal(str(max_longitude)),
+    fields: list[str] | None = None,
+    equipment_ids: list[UUID] | None = None,
+    equipment_match: str = "all",
+) -> list[dict]:
+    """
+    Get parks within a geographic bounding box.
+
+    Approved parks are served from the in-memory spatial index; other statuses
+    go through the per-tile location cache, which holds park ids and
+    coordinates only, and the requested columns are then selected by id.
+    Both hold each park's equipment ids, so the equipment filter is applied
+    in memory. The result is a list of plain dicts (all ParkResponse fields,
+    or only ``fields``).
+    """
+    fields = fields or PARK_RESPONSE_FIELDS
+    if status == "approved":
+        park_index.ensure_loaded(db)
+        parks = park_index.query(
+            min_latitude=min_latitude,
+            max_latitude=max_latitude,
+            min_longitude=min_longitude,
+            max_longitude=max_longitude,
+        )
+        if equipment_ids:
+            parks = _filter_equipment(parks, equipment_ids, equipment_match)
+        return _project(parks, fields)
+
+    entries = park_location_cache.query(
+        db,
+        min_latitude=min_latitude,
+        max_latitude=max_latitude,
+        min_longitude=min_longitude,
+        max_longitude=max_longitude,
         status=status,
     )
+    if equipment_ids:
+        entries = _filter_equipment(entries, equipment_ids, equipment_match)
+    return _project(_select_fields(db, entries, fields, status), fields)
+
+def _select_fields(db: Session, entries: list[TileEntry], fields: list[str], status: str | None) -> list:
+    """
+    Rows holding ``fields`` for cached tile entries, in entry order. Columns
+    the tiles do not hold are selected by id; parks deleted or moved to
+    another status since their tile was cached are dropped.
+    """
+    if set(fields) <= set(TILE_FIELDS):
+        return entries
+    rows = {
+        row.id: row
+        for row in get_parks_by_ids(db, [entry.id for entry in entries], fields, status=status)
+    }
+    return [rows[entry.id] for entry in entries if entry.id in rows]
+
+def get_location_cache_stats() -> ParkLocationCacheStatsResponse:
+    """Hit, miss and eviction counters of the location tile cache."""
+    return ParkLocationCacheStatsResponse(**park_location_cache.stats())
+
+def get_parks_location_delta(
+    db: Session,
+    min_latitude: float,
+    max_latitude: float,
+    min_longitude: float,
+    max_longitude: float,
+    previous_min_latitude: float,
+    previous_max_latitude: float,
+    previous_min_longitude: float,
+    previous_max_longitude: float,
+    status: str | None = "approved",
+) -> ParkLocationDeltaResponse:
+    """
+    Get parks that entered the viewport since the previous bounding box and
+    the ids of parks that left it.
+    """
+    box = (min_latitude, max_latitude, min_longitude, max_longitude)
+    previous_box = (
+        previous_min_latitude,
+        previous_max_latitude,
+        previous_min_longitude,
+        previous_max_longitude,
+    )
+
+    if status == "approved":
+        park_index.ensure_loaded(db)
+
+        def inside(record, bounds) -> bool:
+            return (
+                bounds[0] <= record.latitude <= bounds[1]
+                and bounds[2] <= record.longitude <= bounds[3]
+            )
+
+        added = [r for r in park_index.query(*box) if not inside(r, previous_box)]
+        removed = [r.id for r in park_index.query(*previous_box) if not inside(r, box)]
+    else:
+        added, removed = get_parks_by_location_delta(
+            db,
+            tuple(Decimal(str(value)) for value in box),
+            tuple(Decimal(str(value)) for value in previous_box),
+            status=status,
+        )
+    return ParkLocationDeltaResponse(
+        added=[ParkResponse.model_validate(park) for park in added],
+        removed=removed,
+    )
+
+def get_parks_in_locations(
+    db: Session,
+    request: ParkLocationBatchRequest,
+) -> ParkLocationBatchResponse:
+    """
+    Get parks for several bounding boxes at once, keyed by viewport.
+
+    Approved parks come from the in-memory index; other statuses are answered
+    by one VALUES-joined query for all boxes.
+    """
+    keys = [
+        viewport.key if viewport.key is not None else str(idx)
+        for idx, viewport in enumerate(request.viewports)
+    ]
+    if len(set(keys)) != len(keys):
+        raise HTTPException(status_code=400, detail="Viewport keys must be unique")
+
+    matches: list[tuple[int, object]] = []
+    if request.status == "approved":
+        park_index.ensure_loaded(db)
+        for idx, viewport in enumerate(request.viewports):
+            for record in park_index.query(
+                min_latitude=viewport.min_latitude,
+                max_latitude=viewport.max_latitude,
+                min_longitude=viewport.min_longitude,
+                max_longitude=viewport.max_longitude,
+            ):
+                matches.append((idx, record))
+    else:
+        boxes = [
+            (
+                Decimal(str(viewport.min_latitude)),
+                Decimal(str(viewport.max_latitude)),
+                Decimal(str(viewport.min_longitude)),
+                Decimal(str(viewport.max_longitude)),
+            )
+            for viewport in request.viewports
+        ]
+        matches = get_parks_by_locations(db, boxes, status=request.status)
+
+    by_viewport: dict[str, list[UUID]] = {key: [] for key in keys}
+    parks: dict[UUID, object] = {}
+    for idx, park in matches:
+        by_viewport[keys[idx]].append(park.id)
+        parks.setdefault(park.id, park)
+    return ParkLocationBatchResponse(
+        viewports=by_viewport,
+        parks=[ParkResponse.model_validate(park) for park in parks.values()],
+    )
+
+def _encode_distance_cursor(distance: float, park_id: UUID) -> str:
+    payload = json.dumps({"d": distance, "id": str(park_id)}).encode()
+    return base64.urlsafe_b64encode(payload).decode()
+
+def _decode_distance_cursor(cursor: str) -> tuple[float, UUID]:
+    try:
+        payload = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        distance, park_id = float(payload["d"]), UUID(payload["id"])
+    except (binascii.Error, ValueError, KeyError, TypeError, AttributeError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    if not math.isfinite(distance):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    return distance, park_id
+
+def get_nearest_parks(
+    db: Session,
+    latitude: float,
+    longitude: float,
+    k: int = 10,
+    cursor: str | None = None,
+) -> NearestParksResponse:
+    """Get the k approved parks closest to a point, paged by an opaque distance cursor."""
+    after = _decode_distance_cursor(cursor) if cursor else None
+    park_index.ensure_loaded(db)
+    # Ask for one extra park to learn whether another page exists.
+    nearest = park_index.nearest(latitude, longitude, k + 1, after=after)
+    page = nearest[:k]
+    data = [
+        NearbyParkResponse.model_validate(
+            {**ParkResponse.model_validate(record).model_dump(), "distance_miles": distance}
+        )
+        for record, distance in page
+    ]
+    next_cursor = None
+    if len(nearest) > k:
+        last_record, last_distance = page[-1]
+        next_cursor = _encode_distance_cursor(last_distance, last_record.id)
+    return NearestParksResponse(data=data, next_cursor=next_cursor)
+
+def notify_park_changed(park: Park, db: Session) -> None:
+    """Patch in-memory park views after a park was created or updated."""
+    _patch_park(park)
+    park_index.record_version(get_parks_version(db))
+
+def _patch_park(park: Park) -> None:
+    was_approved = park_index.get(park.id) is not None
+    park_index.upsert(park)
+    park_clusters.upsert(park)
+    park_location_cache.invalidate_park(park.id, float(park.latitude), float(park.longitude))
+    if was_approved or park.status == INDEXED_STATUS:
+        park_snapshots.schedule_rebuild()
+
+def notify_parks_changed(db: Session, park_ids: list[UUID]) -> None:
+    """Reload parks by id (one query) and patch in-memory park views with them."""
+    for park in get_parks_by_ids(db, park_ids):
+        _patch_park(park)
+    park_index.record_version(get_parks_version(db))
+
+def notify_park_removed(park_id: UUID, db: Session) -> None:
+    """Drop a deleted park from in-memory park views."""
+    was_approved = park_index.get(park_id) is not None
+    park_index.remove(park_id)
+    park_clusters.remove(park_id)
+    park_location_cache.invalidate_park(park_id)
+    if was_approved:
+        park_snapshots.schedule_rebuild()
+    park_index.record_version(get_parks_version(db))
+
+def _submission_details(db: Session, parks: list[Park]) -> list[ParkSubmissionDetail]:
+    """
+    Convert parks to ParkSubmissionDetail responses. Equipment names, image
+    URLs and submitter names are loaded for all parks at once (three queries
+    regardless of how many parks).
+    """
+    park_ids = [park.id for park in parks]
+    equipment_names = get_equipment_names_by_parks(db, park_ids)
+    image_urls = get_image_urls_by_parks(db, park_ids)
+    submitter_names = get_user_names(
+        db, list({park.submitted_by for park in parks if park.submitted_by})
+    )
+    details = []
+    for park in parks:
+        submitter_name = submitter_names.get(park.submitted_by)
+        details.append(
+            ParkSubmissionDetail(
+                id=str(park.id),
+                title=park.name,
+                parkName=park.name,
+                description=park.description,
+                parkDescription=park.description,
+                address=park.address,
+                parkAddress=park.address,
+                equipment=equipment_names[park.id],
+                images=image_urls[park.id],
+                submittedAt=park.submit_date,
+                date=park.submit_date,
+                submitter=submitter_name,
+                user=submitter_name,
+                moderationComment=park.admin_notes or "",
+                status=park.status,
+            )
+        )
+    return details
 
 def park_to_submission_detail(db: Session, park: Park) -> ParkSubmissionDetail:
     """Convert Park to ParkSubmissionDetail response."""
-    equipment_list = get_equipment_by_park(db, park.id)
-    equipment_names = [eq.name for eq in equipment_list]
-    images_list = get_images_by_park(db, park.id)
-    image_urls = [img.image_url for img in images_list if img.image_url]
-    submitter_name = park.submitter.name if park.submitter else None
-    return ParkSubmissionDetail(
-        id=str(park.id),
-        title=park.name,
-        parkName=park.name,
-        description=park.description,
-        parkDescription=park.description,
-        address=park.address,
-        parkAddress=park.address,
-        equipment=equipment_names,
-        images=image_urls,
-        submittedAt=park.submit_date,
-        date=park.submit_date,
-        submitter=submitter_name,
-        user=submitter_name,
-        moderationComment=park.admin_notes or "",
-        status=park.status,
+    return _submission_details(db, [park])[0]
+
+def get_park_submissions(
+    db: Session,
+    status: str | None = "pending",
+    search: str | None = None,
+    page: int = 1,
+    page_size: int = 20,
+) -> ParkSubmissionsListResponse:
+    """One page of the admin submission feed, with pagination metadata."""
+    parks, total_count = get_park_submissions_paginated(
+        db, status=status, search=search, page=page, page_size=page_size
+    )
+    items = [
+        ParkSubmissionItem(
+            id=detail.id,
+            title=detail.title,
+            description=detail.description,
+            address=detail.address,
+            equipment=detail.equipment,
+            images=detail.images,
+            submittedAt=detail.submittedAt,
+            submitter=detail.submitter,
+            moderationComment=detail.moderationComment,
+            status=detail.status,
+        )
+        for detail in _submission_details(db, parks)
+    ]
+    return ParkSubmissionsListResponse(
+        data=items,
+        pagination=PaginationInfo(
+            page=page,
+            pageSize=page_size,
+            totalPages=math.ceil(total_count / page_size),
+            totalItems=total_count,
+        ),
     )
 
+def get_admin_stats(db: Session) -> AdminStatsResponse:
+    """Park totals per status, read from the trigger-maintained counters."""
+    counts = get_park_status_counts(db)
+    return AdminStatsResponse(**counts, total=sum(counts.values()))
+
+def get_park_submission(db: Session, park_id: UUID) -> ParkSubmissionDetail:
+    """Full detail for one submission. Raises HTTPException if not found."""
+    park = get_park(db, park_id)
+    if not park:
+        raise HTTPException(status_code=404, detail="Park submission not found")
+    return park_to_submission_detail(db, park)
+
 def moderate_park_submission(
     park_id: UUID,
     body: ModerateParkSubmissionRequest,
@@ -95,6 +461,7 @@ def moderate_park_submission(
             status_code=400,
             detail="Invalid status or failed to moderate park submission",
         )
+    notify_park_changed(moderated_park, db)
     return park_to_submission_detail(db, moderated_park)
 
 def _cloudflare_image_id_from_url(url: str) -> str | None:
@@ -115,6 +482,7 @@ async def delete_park_submission(park_id: UUID, db: Session) -> None:
         raise HTTPException(status_code=404, detail="Park submission not found")
 
     images = get_images_for_park(db, park_id)
+    discard_queued_images(db, park_id)
 
     for img in images:
         cf_id = _cloudflare_image_id_from_url(img.image_url)
@@ -129,4 +497,6 @@ async def delete_park_submission(park_id: UUID, db: Session) -> None:
     if not success:
         raise HTTPException(status_code=404, detail="Park submission not found")
 
+    notify_park_removed(park_id, db)
+
 
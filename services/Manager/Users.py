@@ -1,12 +1,16 @@
 from typing import Optional
+from fastapi import HTTPException
 from sqlalchemy.orm import Session
 
 from models.database import User
+from models.responses.UsersResponses import UserResponse
 from services.Database.UsersTable import (
     create_user,
     delete_user_by_auth0_id,
     get_user_by_auth0_id,
+    get_users_page,
 )
+from services.Manager.FastJSON import rows_to_dicts
 from ..Adapters.Auth0ManagementAdapter import (
     updateUserPermissions,
     getUser,
@@ -18,6 +22,25 @@ User-related business logic.
 """
 
 
+def get_users_list(
+    db: Session,
+    skip: int = 0,
+    limit: int = 100,
+    cursor: str | None = None,
+) -> tuple[list[dict], str | None]:
+    """
+    Get one page of users as plain dicts (UserResponse fields), plus the
+    cursor for the next page. ``cursor`` takes precedence over ``skip``.
+    """
+    try:
+        rows, next_cursor = get_users_page(
+            db, skip=skip, limit=limit, cursor=cursor, fields=list(UserResponse.model_fields)
+        )
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    return rows_to_dicts(rows), next_cursor
+
+
 def LoginSequence(db: Session, auth0Id: str) -> Optional[User]:
     """Load existing user or create from Auth0 and assign default Auth0 role."""
     user = get_user_by_auth0_id(db, auth0Id)